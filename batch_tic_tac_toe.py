@@ -0,0 +1,181 @@
+__author__ = "David Antonucci"
+__version__ = "1.0.0"
+
+import numpy as np
+from enums import MoveError
+from tic_tac_toe import TicTacToe
+
+
+class BatchTicTacToe:
+    """
+    Many independent TicTacToe games held in one array, where every call moves all of them at once.
+    The rules (move validation order, turn order, and the row/column/diagonal wins and their edges)
+    are the same as TicTacToe's.
+    """
+
+    # Cell values in the board array. Player i is stored as i + 1, so zero is an open cell.
+    EMPTY_CELL: int = 0
+
+    _board: np.ndarray
+    _board_size: int
+    _current_player: np.ndarray
+    _number_of_moves: np.ndarray
+    _players: np.ndarray
+    _winner: np.ndarray
+    _win_edges: np.ndarray
+
+    def __init__(self, number_of_games: int, board_size: int):
+
+        self._board = np.zeros((number_of_games, board_size, board_size), dtype=np.int8)
+        self._board_size = board_size
+        self._current_player = np.zeros(number_of_games, dtype=np.int8)
+        self._number_of_moves = np.zeros(number_of_games, dtype=np.int32)
+        self._players = np.array(['X', 'O', TicTacToe.NEUTRAL_PLAYER])  # -1 indexes the neutral player
+        self._winner = np.full(number_of_games, -1, dtype=np.int8)
+        self._win_edges = np.zeros((number_of_games, 2, 2), dtype=np.int32)
+
+    def __len__(self) -> int:
+        return self._board.shape[0]
+
+    def is_board_full(self) -> np.ndarray:
+        """
+        :return: A bool per game that is True if every cell of that game has been played
+        """
+        return self._number_of_moves == self._board_size ** 2
+
+    def is_winner(self) -> np.ndarray:
+        """
+        :return: A bool per game that is True if somebody has won that game
+        """
+        return self._winner >= 0
+
+    def get_board(self) -> np.ndarray:
+        """
+        Gets a read-only view of all the boards, as (game, y, x). Player i is stored as i + 1 and open cells as 0.
+        """
+        board = self._board.view()
+        board.flags.writeable = False
+        return board
+
+    def get_board_size(self) -> int:
+        return self._board_size
+
+    def get_current_players(self) -> np.ndarray:
+        """
+        :return: The character of the player whose move is being waited for, per game
+        """
+        return self._players[self._current_player]
+
+    def get_winners(self) -> np.ndarray:
+        """
+        :return: The character of the winner of each game, or TicTacToe.NEUTRAL_PLAYER if it has no winner
+        """
+        return self._players[self._winner]
+
+    def get_win_edges(self) -> np.ndarray:
+        """
+        :return: The ((x, y), (x, y)) edges of the win of each game, shaped (game, 2, 2). Games without a win hold zeros.
+        """
+        return self._win_edges.copy()
+
+    def make_moves(self, moves: np.ndarray, active: np.ndarray=None) -> np.ndarray:
+        """
+        Makes one move in every game
+        :param moves: The 0-based (x, y) coordinates of the move for each game, shaped (game, 2)
+        :param active: An optional bool per game; games that are False are left alone and get MoveError.OKAY
+        :return: The MoveError value of the attempted move for each game
+        """
+
+        moves = np.asarray(moves)
+        x = moves[:, 0]
+        y = moves[:, 1]
+        size = self._board_size
+
+        errors = np.full(len(self), MoveError.OKAY.value, dtype=np.int8)
+        pending = np.ones(len(self), dtype=bool) if active is None else np.asarray(active, dtype=bool).copy()
+
+        # Validate in the same order TicTacToe.make_move does
+        won = pending & self.is_winner()
+        errors[won] = MoveError.GAME_WON.value
+        pending &= ~won
+
+        out_of_range = pending & ((x < 0) | (x >= size) | (y < 0) | (y >= size))
+        errors[out_of_range] = MoveError.OUT_OF_RANGE.value
+        pending &= ~out_of_range
+
+        games = np.flatnonzero(pending)
+        x = x[games]
+        y = y[games]
+
+        taken = self._board[games, y, x] != self.EMPTY_CELL
+        errors[games[taken]] = MoveError.TAKEN.value
+        games = games[~taken]
+        x = x[~taken]
+        y = y[~taken]
+
+        # If we make it to here, then it is valid to make the moves
+        players = self._current_player[games]
+        self._board[games, y, x] = players + 1
+        self._number_of_moves[games] += 1
+
+        self._check_for_winners(games, x, y, players)
+
+        # Only change who the player is if the game wasn't won, just like TicTacToe does
+        still_playing = games[self._winner[games] < 0]
+        self._current_player[still_playing] = 1 - self._current_player[still_playing]
+
+        return errors
+
+    def random_legal_moves(self, rng: np.random.Generator) -> np.ndarray:
+        """
+        Picks a uniformly random open cell in every game
+        :param rng: The random generator to draw from
+        :return: The (x, y) move per game, shaped (game, 2). Games with no open cell get (-1, -1).
+        """
+
+        open_cells = (self._board == self.EMPTY_CELL).reshape(len(self), -1)
+
+        # The open cell with the highest random key is a uniform pick among the open cells
+        keys = np.where(open_cells, rng.random(open_cells.shape), -1.0)
+        cells = keys.argmax(axis=1)
+
+        moves = np.stack((cells % self._board_size, cells // self._board_size), axis=1)
+        moves[~open_cells.any(axis=1)] = -1
+        return moves
+
+    def _check_for_winners(self, games: np.ndarray, x: np.ndarray, y: np.ndarray, players: np.ndarray) -> None:
+        """
+        Checks the lines that go through each game's last move, in the same order TicTacToe checks them
+        :param games: The games that just had a move made
+        :param x: The x coordinate of each of those moves
+        :param y: The y coordinate of each of those moves
+        :param players: The player that made each of those moves
+        """
+
+        size = self._board_size
+        last = size - 1
+        span = np.arange(size)
+        marks = (players + 1)[:, np.newaxis]
+
+        horizontal = (self._board[games, y, :] == marks).all(axis=1)
+        vertical = (self._board[games, :, x] == marks).all(axis=1)
+        backward = (x == y) & (self._board[games][:, span, span] == marks).all(axis=1)
+        forward = (x + y == last) & (self._board[games][:, span, last - span] == marks).all(axis=1)
+
+        # Short circuit each check on the ones before it
+        vertical &= ~horizontal
+        backward &= ~(horizontal | vertical)
+        forward &= ~(horizontal | vertical | backward)
+
+        edges = self._win_edges
+        edges[games[horizontal]] = np.stack(
+            (np.stack((np.zeros_like(y[horizontal]), y[horizontal]), axis=1),
+             np.stack((np.full_like(y[horizontal], last), y[horizontal]), axis=1)), axis=1)
+        edges[games[vertical]] = np.stack(
+            (np.stack((x[vertical], np.zeros_like(x[vertical])), axis=1),
+             np.stack((x[vertical], np.full_like(x[vertical], last)), axis=1)), axis=1)
+        edges[games[backward]] = ((0, 0), (last, last))
+        edges[games[forward]] = ((last, 0), (0, last))
+
+        won = horizontal | vertical | backward | forward
+        self._winner[games[won]] = players[won]
@@ -0,0 +1,244 @@
+__author__ = "David Antonucci"
+__version__ = "1.0.0"
+
+import argparse
+import contextlib
+import json
+import os
+import platform
+import random
+import subprocess
+import sys
+import time
+import timeit
+import console_game
+from enums import GameEngine
+from game_factory import create_game
+from tic_tac_toe import TicTacToe
+from typing import Callable, Dict, List, Optional, TextIO, Tuple
+
+DEFAULT_BOARD_SIZES: Tuple[int, ...] = (3, 5, 10, 20)
+
+# How many times each benchmark is repeated; the fastest repeat is the one that gets compared
+_REPEATS: int = 5
+
+
+def _time(function: Callable[[], None], calls_per_run: int=1) -> Dict[str, float]:
+    """
+    Times a function, running it enough times per repeat to take at least 0.2 seconds
+    :param calls_per_run: How many calls of the measured code one run of the function makes
+    :return: The best and mean seconds per call
+    """
+
+    timer = timeit.Timer(function)
+    number, _ = timer.autorange()
+    times = [seconds / (number * calls_per_run) for seconds in timer.repeat(_REPEATS, number)]
+
+    return {"best_seconds": min(times), "mean_seconds": sum(times) / len(times), "calls": number * calls_per_run}
+
+
+def _get_move_order(board_size: int, seed: int=0) -> List[Tuple[int, int]]:
+    """
+    Gets every cell of the board in a repeatable random order
+    """
+
+    moves = [(x, y) for y in range(board_size) for x in range(board_size)]
+    random.Random(seed).shuffle(moves)
+    return moves
+
+
+def _time_make_move(board_size: int, engine: GameEngine) -> Dict[str, float]:
+    """
+    Times make_move on its own. The games are made before the timer starts, and the moves stop at the first win,
+    so every timed call is a real move rather than a GAME_WON early return.
+    :return: The best and mean seconds per move
+    """
+
+    # Find the moves of the repeatable game up to its win (or the end of the board)
+    game = create_game(board_size, engine)
+    moves = []
+    for move in _get_move_order(board_size):
+        game.make_move(move)
+        moves.append(move)
+        if game.is_winner():
+            break
+
+    number = max(1, 20000 // len(moves))  # Enough games for each repeat to make about 20,000 moves
+    times = []
+
+    for _ in range(_REPEATS):
+        games = [create_game(board_size, engine) for _ in range(number)]
+
+        start = time.perf_counter()
+        for game in games:
+            make_move = game.make_move
+            for move in moves:
+                make_move(move)
+        times.append((time.perf_counter() - start) / (number * len(moves)))
+
+    return {"best_seconds": min(times), "mean_seconds": sum(times) / len(times), "calls": number * len(moves)}
+
+
+def _get_half_full_game(board_size: int, engine: GameEngine) -> TicTacToe:
+    """
+    Makes a game where about half the board has been played and nobody has won yet
+    """
+
+    for seed in range(1000):
+        game = create_game(board_size, engine)
+        for move in _get_move_order(board_size, seed)[:(board_size ** 2) // 2]:
+            game.make_move(move)
+
+        if not game.is_winner():
+            return game
+
+    raise ValueError(f"Couldn't make a half full game of size {board_size} without a winner")
+
+
+def benchmark_engine(board_size: int, engine: GameEngine) -> Dict[str, Dict[str, float]]:
+    """
+    Times the TicTacToe methods that get called on every move
+    """
+
+    results = {"make_move": _time_make_move(board_size, engine)}
+
+    game = _get_half_full_game(board_size, engine)
+    for name in ("_check_for_winner", "_get_horizontal_winner", "_get_vertical_winner", "_get_diagonal_winner",
+                 "get_board", "legal_moves", "random_legal_move", "position_hash"):
+        results[name] = _time(getattr(game, name))
+
+    # Clearing the screen is just an escape code in the frame, so the call is timed the way the console game makes it
+    with open(os.devnull, "w") as null_stream, contextlib.redirect_stdout(null_stream):
+        results["print_board_to_console"] = _time(game.print_board_to_console)
+
+    return results
+
+
+def benchmark_console_game(board_size: int) -> Dict[str, Dict[str, float]]:
+    """
+    Times the functional console version's winner check
+    """
+
+    board = [list(row) for row in _get_half_full_game(board_size, GameEngine.LIST).get_board()]
+    return {"console_game.get_winner": _time(lambda: console_game.get_winner(board))}
+
+
+def benchmark_qt(board_size: int) -> Optional[Dict[str, Dict[str, float]]]:
+    """
+    Times building and painting the Qt board, using the offscreen platform so no display is needed
+    :return: The results, or None if PyQt5 isn't installed
+    """
+
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+    try:
+        from PyQt5.QtWidgets import QApplication
+        from qt_gui import QtGui
+    except ImportError:
+        return None
+
+    app = QApplication.instance() or QApplication(sys.argv)
+    gui = QtGui(board_size)
+
+    def restart_game():
+        gui._restart_game()
+        app.processEvents()
+
+    # Restarting is what rebuilds the board for a new game or size
+    results = {"QtGui._restart_game": _time(restart_game)}
+
+    for move in _get_move_order(board_size)[:(board_size ** 2) // 2]:
+        gui._game.make_move(move)
+
+    results["GameBoard.paintEvent"] = _time(gui._game_board.repaint)
+
+    gui.close()
+    gui.deleteLater()
+    app.processEvents()
+
+    return results
+
+
+def run_benchmarks(board_sizes: Tuple[int, ...]=DEFAULT_BOARD_SIZES, include_qt: bool=True) -> Dict:
+    """
+    Runs every benchmark at every board size
+    :return: The results, along with enough about the machine and commit to tell runs apart
+    """
+
+    results = []
+
+    def add(board_size: int, engine: Optional[GameEngine], timings: Dict[str, Dict[str, float]]):
+        for name, timing in timings.items():
+            results.append({"name": name, "board_size": board_size,
+                            "engine": None if engine is None else engine.name.lower(), **timing})
+
+    for board_size in board_sizes:
+        for engine in GameEngine:
+            add(board_size, engine, benchmark_engine(board_size, engine))
+
+        add(board_size, None, benchmark_console_game(board_size))
+
+        if include_qt:
+            qt_results = benchmark_qt(board_size)
+            if qt_results is not None:
+                add(board_size, None, qt_results)
+
+    try:
+        commit = subprocess.run(["git", "rev-parse", "HEAD"], cwd=os.path.dirname(os.path.abspath(__file__)),
+                                stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, universal_newlines=True,
+                                check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+
+    return {
+        "commit": commit,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "results": results,
+    }
+
+
+def compare(baseline: Dict, current: Dict, stream: TextIO=sys.stdout) -> None:
+    """
+    Prints how much faster or slower each benchmark got between two runs
+    :param stream: Where to print the table
+    """
+
+    def key(result):
+        return result["name"], result["board_size"], result["engine"]
+
+    old_results = {key(result): result for result in baseline["results"]}
+
+    print(f"{'Benchmark':<40}{'Size':>6}{'Engine':>10}{'Before us':>12}{'After us':>12}{'Change':>9}", file=stream)
+    for result in current["results"]:
+        old = old_results.get(key(result))
+        if old is None:
+            continue
+
+        before = old["best_seconds"] * 1e6
+        after = result["best_seconds"] * 1e6
+        print(f"{result['name']:<40}{result['board_size']:>6}{result['engine'] or '':>10}"
+              f"{before:>12.3f}{after:>12.3f}{(after / before - 1) * 100 if before else 0:>+8.1f}%", file=stream)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Times the engine, console, and GUI hot paths")
+    parser.add_argument("--sizes", type=int, nargs="+", default=list(DEFAULT_BOARD_SIZES))
+    parser.add_argument("--output", help="Where to write the JSON results (default: stdout)")
+    parser.add_argument("--compare", help="A JSON results file from an earlier run to compare against")
+    parser.add_argument("--no-qt", action="store_true", help="Skip the Qt benchmarks")
+    args = parser.parse_args()
+
+    report = run_benchmarks(tuple(args.sizes), not args.no_qt)
+
+    if args.output is None:
+        json.dump(report, sys.stdout, indent=2)
+        print()
+    else:
+        with open(args.output, "w") as output_file:
+            json.dump(report, output_file, indent=2)
+
+    if args.compare is not None:
+        with open(args.compare) as baseline_file:
+            # The JSON went to stdout if there was no output file, so keep the table out of it
+            compare(json.load(baseline_file), report, sys.stderr if args.output is None else sys.stdout)
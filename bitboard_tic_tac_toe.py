@@ -0,0 +1,302 @@
+__author__ = "David Antonucci"
+__version__ = "1.0.0"
+
+from functools import lru_cache
+from tic_tac_toe import MoveError, TicTacToe
+from typing import List, Optional, Tuple
+
+# A win mask, along with the edges that get reported when it is filled
+WinLine = Tuple[int, Tuple[Tuple[int, int], Tuple[int, int]]]
+
+# The most cells of a row that are turned into board cells with one table lookup
+_TABLE_BITS: int = 8
+
+
+@lru_cache(maxsize=None)
+def get_win_lines(board_size: int) -> Tuple[WinLine, ...]:
+    """
+    Gets every line that wins the game on a board of the given size. Cell (x, y) is bit (y * board_size) + x.
+    :param board_size: The size of the board
+    :return: The rows, then the columns, then the backward and forward diagonals (the order TicTacToe checks them in)
+    """
+
+    last = board_size - 1
+    lines = []
+
+    for row in range(board_size):
+        mask = ((1 << board_size) - 1) << (row * board_size)
+        lines.append((mask, ((0, row), (last, row))))
+
+    for col in range(board_size):
+        mask = sum(1 << ((row * board_size) + col) for row in range(board_size))
+        lines.append((mask, ((col, 0), (col, last))))
+
+    backward_mask = sum(1 << ((i * board_size) + i) for i in range(board_size))
+    forward_mask = sum(1 << ((i * board_size) + (last - i)) for i in range(board_size))
+    lines.append((backward_mask, ((0, 0), (last, last))))
+    lines.append((forward_mask, ((last, 0), (0, last))))
+
+    return tuple(lines)
+
+
+@lru_cache(maxsize=None)
+def get_win_masks(board_size: int) -> Tuple[int, ...]:
+    """
+    Gets just the masks from get_win_lines, for code that only cares if somebody has won
+    :param board_size: The size of the board
+    """
+    return tuple(mask for mask, _ in get_win_lines(board_size))
+
+
+@lru_cache(maxsize=None)
+def get_cell_win_lines(board_size: int) -> Tuple[Tuple[WinLine, ...], ...]:
+    """
+    Gets the win lines that go through each cell, in the order TicTacToe checks them, so a move only needs to check
+    its own lines
+    :param board_size: The size of the board
+    """
+    return tuple(tuple(line for line in get_win_lines(board_size) if line[0] & (1 << cell))
+                 for cell in range(board_size ** 2))
+
+
+@lru_cache(maxsize=None)
+def get_cell_win_masks(board_size: int) -> Tuple[Tuple[int, ...], ...]:
+    """
+    Gets just the masks from get_cell_win_lines, for code that only cares if somebody has won
+    :param board_size: The size of the board
+    """
+    return tuple(tuple(mask for mask, _ in lines) for lines in get_cell_win_lines(board_size))
+
+
+@lru_cache(maxsize=None)
+def _get_cell_table(width: int, players: Tuple[chr, ...], neutral_player: chr) -> Tuple[Optional[Tuple[chr, ...]], ...]:
+    """
+    Gets the cells for every way the two players can hold a run of cells, like symmetry.py's byte tables
+    :param width: How many cells are in the run
+    :return: The cells, indexed by (first player's bits << width) | second player's bits (None if the bits overlap)
+    """
+
+    table = [None] * (1 << (2 * width))
+    for first in range(1 << width):
+        for second in range(1 << width):
+            if not first & second:
+                table[(first << width) | second] = tuple(
+                    players[0] if (first >> bit) & 1 else players[1] if (second >> bit) & 1 else neutral_player
+                    for bit in range(width))
+
+    return tuple(table)
+
+
+@lru_cache(maxsize=None)
+def _get_row_pieces(board_size: int, players: Tuple[chr, ...],
+                    neutral_player: chr) -> Tuple[Tuple[int, int, int, Tuple[Optional[Tuple[chr, ...]], ...]], ...]:
+    """
+    Splits a row into runs of cells that can each be looked up with _get_cell_table
+    :return: Each run's first column, width, mask, and table
+    """
+
+    pieces = []
+    for offset in range(0, board_size, _TABLE_BITS):
+        width = min(_TABLE_BITS, board_size - offset)
+        pieces.append((offset, width, (1 << width) - 1, _get_cell_table(width, players, neutral_player)))
+
+    return tuple(pieces)
+
+
+class BitboardTicTacToe(TicTacToe):
+    """
+    A TicTacToe that stores the board as one integer bitmask per player instead of a list of lists
+    """
+
+    _bitboards: List[int]
+    _cell_win_lines: Tuple[Tuple[WinLine, ...], ...]
+    _column_masks: Tuple[int, ...]
+    _diagonal_masks: Tuple[int, int]
+    _row_masks: Tuple[int, ...]
+
+    def get_board(self) -> Tuple[Tuple[chr]]:
+        """
+        Gets the current game board. It is built from the bitboards on every call, which makes it several times slower
+        than the list engine's (4-7x on a 10x10 board in benchmark.py), so code that calls it often should use
+        get_bitboards.
+        """
+
+        size = self._board_size
+        first, second = self._bitboards
+        pieces = _get_row_pieces(size, self._players, self.NEUTRAL_PLAYER)
+        rows = []
+
+        # Both bitboards are read in one pass, a row at a time, with each piece of a row looked up in a table
+        for _ in range(size):
+            row = ()
+            for offset, width, mask, table in pieces:
+                row += table[(((first >> offset) & mask) << width) | ((second >> offset) & mask)]
+
+            rows.append(row)
+            first >>= size
+            second >>= size
+
+        return tuple(rows)
+
+    def get_bitboards(self) -> Tuple[int, int]:
+        """
+        Gets the cells held by each player, in player order. Cell (x, y) is bit (y * board size) + x.
+        """
+        return self._bitboards[0], self._bitboards[1]
+
+    def _clear_cell(self, move: Tuple[int, int]) -> None:
+        """
+        Opens the given cell, which the current player holds
+        :param move: The 0-based coordinates of the cell
+        """
+        self._bitboards[self._current_player] &= ~(1 << ((move[1] * self._board_size) + move[0]))
+
+    def _copy_board_from(self, game: "BitboardTicTacToe") -> None:
+        """
+        Replaces the bitboards with a copy of the given game's
+        """
+        self._bitboards = game._bitboards[:]
+
+    def _create_board(self) -> None:
+        """
+        Creates the empty bitboards, and looks up the win masks for this board size
+        """
+
+        self._bitboards = [0 for _ in self._players]
+
+        self._cell_win_lines = get_cell_win_lines(self._board_size)
+
+        lines = get_win_masks(self._board_size)
+        self._row_masks = lines[:self._board_size]
+        self._column_masks = lines[self._board_size:-2]
+        self._diagonal_masks = (lines[-2], lines[-1])
+
+    def _get_cell(self, move: Tuple[int, int]) -> chr:
+        """
+        Gets who is in the given cell
+        :param move: The 0-based coordinates of the cell
+        :return: The player in the cell, or self.NEUTRAL_PLAYER if it's open
+        """
+
+        cell = 1 << ((move[1] * self._board_size) + move[0])
+
+        for player, bitboard in enumerate(self._bitboards):
+            if bitboard & cell:
+                return self._players[player]
+
+        return self.NEUTRAL_PLAYER
+
+    def _get_diagonal_winner(self) -> bool:
+        """
+        Checks the diagonals that go through the last move for a winner. If one is found, self._winner will be set.
+        :return: True if there is a winner
+        """
+
+        if self._last_move is None:
+            return False
+
+        col, row = self._last_move
+        bitboard = self._bitboards[self._current_player]
+        backward_mask, forward_mask = self._diagonal_masks
+
+        if col == row and bitboard & backward_mask == backward_mask:
+            self._winner = self._players[self._current_player]
+            self._win_edges = ((0, 0), (self._board_size - 1, self._board_size - 1))
+            return True
+
+        if col + row == self._board_size - 1 and bitboard & forward_mask == forward_mask:
+            self._winner = self._players[self._current_player]
+            self._win_edges = ((self._board_size - 1, 0), (0, self._board_size - 1))
+            return True
+
+        return False
+
+    def _get_horizontal_winner(self) -> bool:
+        """
+        Checks the row that goes through the last move for a winner. If one is found, self._winner will be set.
+        :return: True if there is a winner
+        """
+
+        if self._last_move is None:
+            return False
+
+        row_num = self._last_move[1]
+        mask = self._row_masks[row_num]
+
+        if self._bitboards[self._current_player] & mask == mask:
+            self._winner = self._players[self._current_player]
+            self._win_edges = ((0, row_num), (self._board_size - 1, row_num))
+            return True
+
+        return False
+
+    def _get_vertical_winner(self) -> bool:
+        """
+        Checks the column that goes through the last move for a winner. If one is found, self._winner will be set.
+        :return: True if there is a winner
+        """
+
+        if self._last_move is None:
+            return False
+
+        col = self._last_move[0]
+        mask = self._column_masks[col]
+
+        if self._bitboards[self._current_player] & mask == mask:
+            self._winner = self._players[self._current_player]
+            self._win_edges = ((col, 0), (col, self._board_size - 1))
+            return True
+
+        return False
+
+    def make_move(self, move: Tuple[int, int]) -> MoveError:
+        """
+        Makes the given move on the board
+        :param move: The 0-based coordinates where the move is trying to be made
+        :return: A MoveError that gives the status of the attempted move
+        """
+
+        col, row = move
+
+        if self._winner != self.NEUTRAL_PLAYER:
+            return MoveError.GAME_WON
+
+        elif col >= self._board_size or col < 0 or row >= self._board_size or row < 0:
+            return MoveError.OUT_OF_RANGE
+
+        elif (self._bitboards[0] | self._bitboards[1]) & (1 << ((row * self._board_size) + col)):
+            return MoveError.TAKEN
+
+        if self._redo_moves:
+            self._redo_moves.clear()
+        self._play_move(move)
+
+        return MoveError.OKAY
+
+    def _play_move(self, move: Tuple[int, int]) -> None:
+        """
+        Makes a move that is known to be valid, checking only the win masks that go through its cell
+        :param move: The 0-based coordinates of the move
+        """
+
+        cell = (move[1] * self._board_size) + move[0]
+        player = self._current_player
+        bitboard = self._bitboards[player] | (1 << cell)
+        self._bitboards[player] = bitboard
+        self._record_move(move, cell)
+
+        for mask, win_edges in self._cell_win_lines[cell]:
+            if bitboard & mask == mask:
+                # The turn doesn't pass, so the final board's color is the winner's
+                self._winner = self._players[player]
+                self._win_edges = win_edges
+                return
+
+        self._current_player = (player + 1) % len(self._players)
+
+    def _set_cell(self, move: Tuple[int, int]) -> None:
+        """
+        Puts the current player in the given cell
+        :param move: The 0-based coordinates of the cell
+        """
+        self._bitboards[self._current_player] |= 1 << ((move[1] * self._board_size) + move[0])
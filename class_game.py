@@ -1,14 +1,154 @@
 __author__ = "David Antonucci"
 __version__ = "1.0.0"
 
+import json
 import re
 import sys
+import profiling
 from console_game import get_board_size, ask_for_move
 from console_helper import ConsoleHelper
 from enums import MoveError
 from tic_tac_toe import TicTacToe
+from typing import Dict, Iterable, List, TextIO, Tuple
+
+# Batch games can be bigger than the interactive ones, but not so big that one line can use up all the memory
+BATCH_MAX_BOARD_SIZE: int = 100
+
+# How many result records are collected before they're written out
+_BATCH_BUFFER_RECORDS: int = 1024
+
+_TEXT_MOVE_PATTERN = re.compile(r"^(\d+),(\d+)$")
+
+
+def parse_batch_line(line: str) -> Tuple[int, List[Tuple[int, int]]]:
+    """
+    Reads one game from a line of batch input. Moves are 1-based, just like the interactive game.
+    The line is either text, such as "3 1,1 2,2 1,2" (the board size, then each move as x,y), or a JSON object,
+    such as {"size": 3, "moves": [[1, 1], [2, 2], [1, 2]]}.
+    :return: The board size, and the 1-based (x, y) moves
+    :raises ValueError: If the line isn't a game
+    """
+
+    if line.startswith("{"):
+        game = json.loads(line)
+        if not isinstance(game, dict):
+            raise ValueError("The game is not a JSON object")
+
+        size = game.get("size")
+        moves = game.get("moves", [])
+        if (not isinstance(moves, list) or
+                not all(isinstance(move, list) and len(move) == 2 and all(type(value) is int for value in move)
+                        for move in moves)):
+            raise ValueError("The moves must be a list of [x, y] pairs")
+
+        moves = [(move[0], move[1]) for move in moves]
+    else:
+        fields = line.split()
+        if not fields or re.match(r"^\d+$", fields[0]) is None:
+            raise ValueError("The line must start with the board size")
+
+        size = int(fields[0])
+        moves = []
+        for field in fields[1:]:
+            match = _TEXT_MOVE_PATTERN.match(field)
+            if match is None:
+                raise ValueError(f"{field} is not a move in the format x,y")
+            moves.append((int(match[1]), int(match[2])))
+
+    if type(size) is not int or size < 1 or size > BATCH_MAX_BOARD_SIZE:
+        raise ValueError(f"The board size must be from 1 to {BATCH_MAX_BOARD_SIZE}")
+
+    return size, moves
+
+
+def play_batch_game(board_size: int, moves: Iterable[Tuple[int, int]]) -> Dict[str, object]:
+    """
+    Plays a game's 1-based moves, without drawing anything
+    :return: The result record: the board size, how many moves were played, the result ("X", "O", "tie",
+             or "unfinished"), the 1-based win edges if somebody won, and the error and 1-based move number of the
+             first move that couldn't be made (the rest of the game isn't played)
+    """
+
+    game = TicTacToe(board_size)
+    record = {"size": board_size}
+    played = 0
+
+    for move in moves:
+        response = game.make_move((move[0] - 1, move[1] - 1))
+        if response != MoveError.OKAY:
+            record["error"] = response.name
+            record["error_move"] = played + 1
+            break
+
+        played = played + 1
+
+    record["moves"] = played
+
+    if game.is_winner():
+        record["result"] = game.get_winner()
+        record["win_edges"] = [[x + 1, y + 1] for x, y in game.get_win_edges()]
+    elif game.is_board_full():
+        record["result"] = "tie"
+    else:
+        record["result"] = "unfinished"
+
+    return record
+
+
+def run_batch(input_stream: TextIO, output_stream: TextIO) -> int:
+    """
+    Plays every game in the input (one per line), and writes one JSON result record per game to the output.
+    Blank lines and lines starting with # are skipped. Lines that aren't games get a record with an error.
+    :return: How many games were read
+    """
+
+    buffer = []
+    games = 0
+
+    for line_number, line in enumerate(input_stream, 1):
+        line = line.strip()
+        if not line or line.startswith("#"):
+            continue
+
+        games = games + 1
+
+        try:
+            size, moves = parse_batch_line(line)
+        # json.JSONDecodeError is a ValueError too, and a deeply nested line makes json raise RecursionError
+        except (RecursionError, ValueError) as error:
+            record = {"line": line_number, "result": "invalid", "error": "BAD_LINE", "message": str(error)}
+        else:
+            record = {"line": line_number}
+            record.update(play_batch_game(size, moves))
+
+        buffer.append(json.dumps(record, separators=(",", ":")))
+
+        if len(buffer) >= _BATCH_BUFFER_RECORDS:
+            buffer.append("")
+            output_stream.write("\n".join(buffer))
+            buffer.clear()
+
+    if buffer:
+        buffer.append("")
+        output_stream.write("\n".join(buffer))
+
+    output_stream.flush()
+    return games
+
 
 if __name__ == "__main__":
+    profiling.enable_from_environment()
+
+    # Headless batch mode: class_game.py --batch [file], reading from stdin if there's no file (or it's -)
+    if len(sys.argv) > 1 and sys.argv[1] == "--batch":
+        if len(sys.argv) > 2 and sys.argv[2] != "-":
+            with open(sys.argv[2]) as batch_file:
+                run_batch(batch_file, sys.stdout)
+        else:
+            run_batch(sys.stdin, sys.stdout)
+
+        sys.exit(0)
+
     while True:
 
         game = None
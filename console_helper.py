@@ -1,7 +1,7 @@
 __author__ = "David Antonucci"
 __version__ = "1.0.0"
 
-from colorama import Back, Fore, Style
+from colorama import Back, Cursor, Fore, Style, ansi
 from enums import Color
 from typing import Dict
 
@@ -28,6 +28,23 @@ class ConsoleHelper:
     __last_back_colors = [Color.BLACK]
     __last_fore_colors = [Color.WHITE]
 
+    # Clears the screen, and moves the cursor back to the top left
+    CLEAR_SCREEN: str = ansi.clear_screen() + Cursor.POS(1, 1)
+
+    @staticmethod
+    def get_background_code(background: Color) -> str:
+        """
+        Gets the escape code that sets the background color, for building up output before printing it
+        """
+        return ConsoleHelper.__back_colors[background]
+
+    @staticmethod
+    def get_foreground_code(foreground: Color) -> str:
+        """
+        Gets the escape code that sets the foreground (text) color, for building up output before printing it
+        """
+        return ConsoleHelper.__fore_colors[foreground]
+
     @staticmethod
     def set_print_background(background: Color, save_color=True) -> None:
         """
@@ -0,0 +1,344 @@
+__author__ = "David Antonucci"
+__version__ = "1.0.0"
+
+import curses
+import re
+import sys
+import profiling
+from enums import Color, MoveError
+from tic_tac_toe import TicTacToe
+from typing import Dict, List, Set, Tuple
+
+_CURSES_COLORS: Dict[Color, int] = {
+    Color.BLACK: curses.COLOR_BLACK,
+    Color.WHITE: curses.COLOR_WHITE,
+    Color.RED: curses.COLOR_RED,
+    Color.GREEN: curses.COLOR_GREEN,
+    Color.BLUE: curses.COLOR_BLUE,
+    Color.YELLOW: curses.COLOR_YELLOW,
+}
+
+# Where the board starts on the screen. The status line is above it.
+_BOARD_TOP: int = 2
+_BOARD_LEFT: int = 4
+_CELL_WIDTH: int = 4
+_CELL_HEIGHT: int = 2
+
+_MOVE_KEYS: Dict[int, Tuple[int, int]] = {
+    curses.KEY_LEFT: (-1, 0), ord('a'): (-1, 0),
+    curses.KEY_RIGHT: (1, 0), ord('d'): (1, 0),
+    curses.KEY_UP: (0, -1), ord('w'): (0, -1),
+    curses.KEY_DOWN: (0, 1), ord('s'): (0, 1),
+}
+
+
+class CursesGame:
+    """
+    A terminal front end that remembers what is already on the screen and only redraws what a move changes
+    (the played cell, the old and new last-move highlight, and the status line), instead of the whole board.
+    Moves are picked with the arrow keys (or WASD) and Enter/Space, or by clicking a cell.
+    U takes back the last move, and R makes it again.
+    A board too big for the terminal scrolls to keep the selected cell on the screen.
+    """
+
+    _board_size: int
+    _cursor: Tuple[int, int]
+    _dirty_cells: Set[Tuple[int, int]]
+    _drawn_cells: Dict[Tuple[int, int], Tuple[str, int]]
+    _drawn_status: str
+    _first_cell: Tuple[int, int]
+    _game: TicTacToe
+    _played_cells: Dict[Tuple[int, int], Tuple[chr, Color]]
+    _screen = None
+
+    def __init__(self, screen, board_size: int):
+
+        self._board_size = board_size
+        self._cursor = (0, 0)
+        self._dirty_cells = set()  # The cells that may need to be redrawn
+        self._drawn_cells = {}  # What each cell currently shows on the screen, and with what attributes
+        self._drawn_status = None
+        self._first_cell = (0, 0)  # The (column, row) of the top left cell on the screen
+        self._game = TicTacToe(board_size)
+        self._played_cells = {}  # The player who played each cell, and their color (so the board isn't rebuilt)
+        self._screen = screen
+
+        curses.curs_set(1)
+        curses.mousemask(curses.BUTTON1_CLICKED | curses.BUTTON1_PRESSED)
+        screen.keypad(True)
+
+        if curses.has_colors():
+            curses.start_color()
+            for color, curses_color in _CURSES_COLORS.items():
+                curses.init_pair(color.value + 1, curses_color, curses.COLOR_BLACK)
+
+    def run(self) -> None:
+        """
+        Plays games until the player quits
+        """
+
+        self._draw_grid()
+
+        while True:
+            self._update_screen()
+
+            key = self._screen.getch()
+
+            if key in (ord('q'), 27):  # q or escape
+                return
+
+            elif key == ord('n') and (self._game.is_winner() or self._game.is_board_full()):
+                self._dirty_cells.update(self._played_cells)
+                self._played_cells.clear()
+                self._game = TicTacToe(self._board_size)
+
+            elif key in _MOVE_KEYS:
+                dx, dy = _MOVE_KEYS[key]
+                self._cursor = (min(max(self._cursor[0] + dx, 0), self._board_size - 1),
+                                min(max(self._cursor[1] + dy, 0), self._board_size - 1))
+                self._scroll_to_cursor()
+
+            elif key == curses.KEY_RESIZE:
+                self._first_cell = (0, 0)
+                self._draw_grid()
+                self._scroll_to_cursor()
+
+            elif key in (ord(' '), ord('\n'), curses.KEY_ENTER):
+                self._make_move(self._cursor)
+
+            elif key == curses.KEY_MOUSE:
+                self._click()
+
+            elif key == ord('u'):
+                self._undo_move()
+
+            elif key == ord('r'):
+                self._redo_move()
+
+    def _click(self) -> None:
+        """
+        Plays the cell that was clicked, if a cell was clicked
+        """
+
+        try:
+            _, x, y, _, _ = curses.getmouse()
+        except curses.error:
+            return
+
+        col = ((x - _BOARD_LEFT) // _CELL_WIDTH) + self._first_cell[0]
+        row = ((y - _BOARD_TOP) // _CELL_HEIGHT) + self._first_cell[1]
+
+        # Clicks on the grid lines don't count
+        if (x < _BOARD_LEFT or y < _BOARD_TOP or (y - _BOARD_TOP) % _CELL_HEIGHT != 0 or
+                (x - _BOARD_LEFT) % _CELL_WIDTH == _CELL_WIDTH - 1):
+            return
+
+        if self._make_move((col, row)) != MoveError.OUT_OF_RANGE:
+            self._cursor = (col, row)
+            self._scroll_to_cursor()
+
+    def _draw_grid(self) -> None:
+        """
+        Draws the parts of the board that only change when it scrolls: the column and row numbers, and the grid lines
+        """
+
+        screen = self._screen
+        screen.erase()
+
+        first_col, first_row = self._first_cell
+        visible_cols, visible_rows = self._get_visible_cells()
+        cols = range(first_col, min(first_col + visible_cols, self._board_size))
+        rows = range(first_row, min(first_row + visible_rows, self._board_size))
+
+        for col in cols:
+            self._add_string(_BOARD_TOP - 1, _BOARD_LEFT + ((col - first_col) * _CELL_WIDTH), f" {col + 1}")
+
+        separator = "+".join("---" for _ in cols)
+        for row in rows:
+            y = _BOARD_TOP + ((row - first_row) * _CELL_HEIGHT)
+            self._add_string(y, 0, f" {row + 1: >2}")
+            for col in cols:
+                if col < self._board_size - 1:
+                    self._add_string(y, _BOARD_LEFT + ((col - first_col) * _CELL_WIDTH) + 3, "|")
+
+            if row < self._board_size - 1:
+                self._add_string(y + 1, _BOARD_LEFT, separator)
+
+        self._drawn_cells.clear()
+        self._drawn_status = None
+        self._dirty_cells.update((col, row) for row in range(self._board_size) for col in range(self._board_size))
+
+    def _get_visible_cells(self) -> Tuple[int, int]:
+        """
+        Gets how many columns and rows of cells fit on the screen (at least one of each)
+        """
+
+        height, width = self._screen.getmaxyx()
+        return (max(1, ((width - _BOARD_LEFT - 3) // _CELL_WIDTH) + 1),
+                max(1, (height - _BOARD_TOP + _CELL_HEIGHT - 1) // _CELL_HEIGHT))
+
+    def _get_win_cells(self) -> List[Tuple[int, int]]:
+        """
+        Gets the cells of the winning line, if there is one
+        """
+
+        if not self._game.is_winner():
+            return []
+
+        (begin_x, begin_y), (end_x, end_y) = self._game.get_win_edges()
+        steps = max(abs(end_x - begin_x), abs(end_y - begin_y))
+        dx = (end_x > begin_x) - (end_x < begin_x)
+        dy = (end_y > begin_y) - (end_y < begin_y)
+
+        return [(begin_x + (i * dx), begin_y + (i * dy)) for i in range(steps + 1)]
+
+    def _make_move(self, move: Tuple[int, int]) -> MoveError:
+        """
+        Makes a move, and marks the cells whose look it changes as needing to be redrawn
+        """
+
+        player = (self._game.get_current_player(), self._game.get_current_player_color())
+        previous_move = self._game.get_last_move()
+
+        result = self._game.make_move(move)
+        if result == MoveError.OKAY:
+            self._played_cells[move] = player
+            self._dirty_cells.add(move)
+            if previous_move is not None:
+                self._dirty_cells.add(previous_move)
+            self._dirty_cells.update(self._get_win_cells())
+
+        return result
+
+    def _redo_move(self) -> None:
+        """
+        Makes the last undone move again, and marks the cells whose look it changes as needing to be redrawn
+        """
+
+        player = (self._game.get_current_player(), self._game.get_current_player_color())
+        previous_move = self._game.get_last_move()
+
+        move = self._game.redo_move()
+        if move is not None:
+            self._played_cells[move] = player
+            self._dirty_cells.add(move)
+            if previous_move is not None:
+                self._dirty_cells.add(previous_move)
+            self._dirty_cells.update(self._get_win_cells())
+
+    def _undo_move(self) -> None:
+        """
+        Takes back the last move, and marks the cells whose look it changes as needing to be redrawn
+        """
+
+        win_cells = self._get_win_cells()
+
+        move = self._game.undo_move()
+        if move is not None:
+            del self._played_cells[move]
+            self._dirty_cells.add(move)
+            self._dirty_cells.update(win_cells)
+
+            last_move = self._game.get_last_move()
+            if last_move is not None:
+                self._dirty_cells.add(last_move)
+
+    def _scroll_to_cursor(self) -> None:
+        """
+        Scrolls the board as little as possible so the selected cell is on the screen, and redraws it if it moved
+        """
+
+        visible_cols, visible_rows = self._get_visible_cells()
+        col, row = self._cursor
+
+        first_col = min(max(self._first_cell[0], col - visible_cols + 1), col)
+        first_row = min(max(self._first_cell[1], row - visible_rows + 1), row)
+
+        if (first_col, first_row) != self._first_cell:
+            self._first_cell = (first_col, first_row)
+            self._draw_grid()
+
+    def _update_screen(self) -> None:
+        """
+        Redraws only the cells and status text that are different from what is already on the screen
+        """
+
+        first_col, first_row = self._first_cell
+        visible_cols, visible_rows = self._get_visible_cells()
+        last_move = self._game.get_last_move()
+        win_cells = set(self._get_win_cells())
+
+        for col, row in self._dirty_cells:
+            # Cells that are scrolled off the screen are drawn when they're scrolled back on
+            if not (first_col <= col < first_col + visible_cols and first_row <= row < first_row + visible_rows):
+                continue
+
+            cell, color = self._played_cells.get((col, row), (TicTacToe.NEUTRAL_PLAYER, None))
+            attributes = 0
+
+            if color is not None and curses.has_colors():
+                attributes |= curses.color_pair(color.value + 1)
+
+            if (col, row) in win_cells:
+                attributes |= curses.A_BOLD | curses.A_UNDERLINE
+            elif last_move == (col, row):
+                attributes |= curses.A_REVERSE
+
+            if self._drawn_cells.get((col, row)) != (cell, attributes):
+                self._drawn_cells[(col, row)] = (cell, attributes)
+                self._add_string(_BOARD_TOP + ((row - first_row) * _CELL_HEIGHT),
+                                 _BOARD_LEFT + ((col - first_col) * _CELL_WIDTH), f" {cell} ", attributes)
+
+        self._dirty_cells.clear()
+
+        if self._game.is_winner():
+            status = f"Player {self._game.get_winner()} won! Press n for a new game or q to quit."
+        elif self._game.is_board_full():
+            status = "Oh no! It was a tie! Press n for a new game or q to quit."
+        else:
+            status = f"Waiting for Player {self._game.get_current_player()}"
+
+        if status != self._drawn_status:
+            self._drawn_status = status
+            self._move_cursor(0, 0)
+            self._screen.clrtoeol()
+            self._add_string(0, 0, status)
+
+        # Leave the terminal's cursor on the selected cell
+        self._move_cursor(_BOARD_TOP + ((self._cursor[1] - first_row) * _CELL_HEIGHT),
+                          _BOARD_LEFT + ((self._cursor[0] - first_col) * _CELL_WIDTH) + 1)
+        self._screen.refresh()
+
+    def _add_string(self, y: int, x: int, text: str, attributes: int=0) -> None:
+        """
+        Writes text to the screen, ignoring anything that falls off the edge of a small terminal
+        """
+
+        try:
+            self._screen.addstr(y, x, text, attributes)
+        except curses.error:
+            pass
+
+    def _move_cursor(self, y: int, x: int) -> None:
+        """
+        Moves the terminal's cursor, ignoring a position that is off the edge of a small terminal
+        """
+
+        try:
+            self._screen.move(y, x)
+        except curses.error:
+            pass
+
+
+def main(screen) -> None:
+    board_size = 3
+
+    if len(sys.argv) > 1 and re.match("^\d+$", sys.argv[1]) is not None:
+        board_size = int(sys.argv[1])
+
+    CursesGame(screen, board_size).run()
+
+
+if __name__ == "__main__":
+    profiling.enable_from_environment()
+    curses.wrapper(main)
@@ -18,3 +18,8 @@ class MoveError(Enum):
     OUT_OF_RANGE = 1
     TAKEN = 2
     GAME_WON = 3
+
+
+class GameEngine(Enum):
+    LIST = 0
+    BITBOARD = 1
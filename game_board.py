@@ -0,0 +1,226 @@
+__author__ = "David Antonucci"
+__version__ = "1.0.0"
+
+import PyQt5.Qt as Qt
+from PyQt5.QtGui import QColor, QMouseEvent, QPaintEvent, QPixmap
+from PyQt5.QtWidgets import QWidget
+from tic_tac_toe import TicTacToe
+from typing import Dict, Optional, Tuple
+
+
+class GameBoard(QWidget):
+    """
+    Draws the whole game board (grid lines, marks, and the win line) itself, and works out which cell
+    was clicked from the click position, so the board is one widget no matter how many cells it has.
+    The grid lines never change during a game, so they are drawn once into a cached pixmap, and a move
+    only repaints the cell it was made in (and the win line, if it won).
+    """
+
+    cell_clicked = Qt.pyqtSignal(object)  # The (row, column) of the clicked cell
+
+    _game: TicTacToe
+    _grid_pixmap: Optional[QPixmap]
+    _mark_font: Qt.QFont
+    _player_colors: Dict[chr, QColor]
+
+    CELL_SIZE: int = 75
+    SPACING: int = 5
+    _LINE_COLOR: QColor = Qt.QColor(0, 0, 0)
+
+    def __init__(self, game: TicTacToe, parent: QWidget=None):
+        # noinspection PyArgumentList
+        super().__init__(parent)
+
+        self._game = None  # The game being drawn
+        self._grid_pixmap = None  # The grid lines for the current board size and pixel ratio
+        self._mark_font = Qt.QFont("sans serif", 45)  # We're using a giant font for the X's and O's
+        self._player_colors = {}  # The color each player's marks are drawn in
+
+        self.set_game(game)
+
+    def get_cell_rect(self, cell_coordinates: Tuple[int, int]) -> Qt.QRect:
+        """
+        Gets where a cell is drawn
+        :param cell_coordinates: The (row, column) of the cell
+        """
+
+        pitch = self.CELL_SIZE + self.SPACING
+        return Qt.QRect(cell_coordinates[1] * pitch, cell_coordinates[0] * pitch, self.CELL_SIZE, self.CELL_SIZE)
+
+    def set_game(self, game: TicTacToe) -> None:
+        """
+        Sets the game that the board shows, resizing the board to fit it
+        """
+
+        if self._game is None or game.get_board_size() != self._game.get_board_size():
+            self._grid_pixmap = None
+
+        self._game = game
+
+        board_size = game.get_board_size()
+        long_size = (self.SPACING * (board_size - 1)) + (self.CELL_SIZE * board_size)
+        self.setFixedSize(long_size, long_size)
+
+        self.update()
+
+    def update_cell(self, cell_coordinates: Tuple[int, int]) -> None:
+        """
+        Schedules a repaint of just the given cell, plus the win line if the game has been won
+        :param cell_coordinates: The (row, column) of the cell that changed
+        """
+
+        self.update(self.get_cell_rect(cell_coordinates))
+
+        if self._game.is_winner():
+            start, end = self._get_win_line()
+            self.update(Qt.QRectF(start, end).normalized()
+                        .adjusted(-self.SPACING, -self.SPACING, self.SPACING, self.SPACING).toAlignedRect())
+
+    def set_player_color(self, player: chr, color: QColor) -> None:
+        """
+        Sets the color that a player's marks are drawn in
+        """
+        self._player_colors[player] = color
+
+    def mousePressEvent(self, event: QMouseEvent) -> None:
+        if event.button() != Qt.Qt.LeftButton:
+            return QWidget.mousePressEvent(self, event)
+
+        event.accept()
+
+        cell = self._get_cell_at(event.pos().x(), event.pos().y())
+        if cell is not None:
+            self.cell_clicked.emit(cell)
+
+    def paintEvent(self, event: QPaintEvent) -> None:
+        """
+        Paints the grid lines, the marks, and the win line
+        :param event: The paint event information
+        """
+
+        qp = Qt.QPainter()
+        qp.begin(self)
+
+        # The grid lines, cleared to the background everywhere else
+        dirty_rect = event.rect()
+        qp.drawPixmap(dirty_rect, self._get_grid_pixmap(), self._to_pixmap_rect(dirty_rect))
+
+        # Draw the marks that are in the part being repainted
+        board_size = self._game.get_board_size()
+        pitch = self.CELL_SIZE + self.SPACING
+        first_row = max(0, dirty_rect.top() // pitch)
+        last_row = min(board_size - 1, dirty_rect.bottom() // pitch)
+        first_col = max(0, dirty_rect.left() // pitch)
+        last_col = min(board_size - 1, dirty_rect.right() // pitch)
+
+        board = self._game.get_board()
+        qp.setFont(self._mark_font)
+        for row_num in range(first_row, last_row + 1):
+            for col_num in range(first_col, last_col + 1):
+                cell = board[row_num][col_num]
+                if cell != TicTacToe.NEUTRAL_PLAYER:
+                    qp.setPen(self._player_colors.get(cell, self._LINE_COLOR))
+                    qp.drawText(self.get_cell_rect((row_num, col_num)), Qt.Qt.AlignCenter, cell)
+
+        # If we have a winner, then draw the line that crosses the n-in-a-row
+        if self._game.is_winner():
+            self._draw_win_line(qp)
+
+        # Finalize the drawing
+        qp.end()
+
+    def _draw_win_line(self, qp: Qt.QPainter) -> None:
+        """
+        Draws the line through the winning cells, in the winner's color
+        """
+
+        # Set the pen to be thick, and the color of the winner, then draw it
+        qp.setPen(Qt.QPen(self._player_colors.get(self._game.get_winner(), self._LINE_COLOR), self.SPACING))
+        qp.drawLine(*self._get_win_line())
+
+    def _get_cell_at(self, x: int, y: int) -> Optional[Tuple[int, int]]:
+        """
+        Works out which cell a point is in
+        :return: The (row, column) of the cell, or None if the point is on a grid line or off the board
+        """
+
+        pitch = self.CELL_SIZE + self.SPACING
+        board_size = self._game.get_board_size()
+
+        if x < 0 or y < 0 or x % pitch >= self.CELL_SIZE or y % pitch >= self.CELL_SIZE:
+            return None
+
+        row, col = y // pitch, x // pitch
+        if row >= board_size or col >= board_size:
+            return None
+
+        return row, col
+
+    def _get_grid_pixmap(self) -> QPixmap:
+        """
+        Gets the grid lines drawn over the background, drawing them if the board size or pixel ratio has changed
+        """
+
+        ratio = self.devicePixelRatioF()
+        if self._grid_pixmap is not None and self._grid_pixmap.devicePixelRatioF() == ratio:
+            return self._grid_pixmap
+
+        # Draw at the screen's real resolution, so the lines stay sharp on high-DPI displays
+        pixmap = QPixmap(round(self.width() * ratio), round(self.height() * ratio))
+        pixmap.setDevicePixelRatio(ratio)
+        pixmap.fill(self.palette().color(self.backgroundRole()))
+
+        qp = Qt.QPainter()
+        qp.begin(pixmap)
+
+        pitch = self.CELL_SIZE + self.SPACING
+        long_size = self.width()
+
+        # Draw each horizontal and vertical line
+        for cross in range(self._game.get_board_size() - 1):
+            position = (cross * pitch) + self.CELL_SIZE
+            qp.fillRect(0, position, long_size, self.SPACING, self._LINE_COLOR)
+            qp.fillRect(position, 0, self.SPACING, long_size, self._LINE_COLOR)
+
+        qp.end()
+
+        self._grid_pixmap = pixmap
+        return pixmap
+
+    def _get_win_line(self) -> Tuple[Qt.QPointF, Qt.QPointF]:
+        """
+        Gets where the line through the winning cells starts and ends
+        """
+
+        cell_size = self.CELL_SIZE  # shorthand
+        pitch = cell_size + self.SPACING
+
+        (begin_x, begin_y), (end_x, end_y) = self._game.get_win_edges()
+
+        # Figure out where we're starting, and where we're ending.
+        # For the end coordinates, we need to add the final cell, if the direction we're going is not zero
+        # (otherwise we'd get an angled line)
+        x_start = begin_x * pitch
+        y_start = begin_y * pitch
+        x_end = (end_x * pitch) + (cell_size if end_x > 0 else 0)
+        y_end = (end_y * pitch) + (cell_size if end_y > 0 else 0)
+
+        # Shift half a cell for horizontal and vertical (so they're in the middle), and push all the way
+        # to the right if we have a win from the top right to the bottom left
+        if begin_x == end_x:  # Vertical win
+            x_start = x_end = x_start + (cell_size / 2)
+        elif begin_y == end_y:  # Horizontal win
+            y_start = y_end = y_start + (cell_size / 2)
+        elif begin_x == end_y:  # Top right to bottom left
+            x_start = x_start + cell_size
+
+        return Qt.QPointF(x_start, y_start), Qt.QPointF(x_end, y_end)
+
+    def _to_pixmap_rect(self, rect: Qt.QRect) -> Qt.QRect:
+        """
+        Converts a rectangle of the widget to the same area of the grid pixmap, which may have more pixels
+        """
+
+        ratio = self._grid_pixmap.devicePixelRatioF()
+        return Qt.QRect(round(rect.x() * ratio), round(rect.y() * ratio),
+                        round(rect.width() * ratio), round(rect.height() * ratio))
@@ -0,0 +1,202 @@
+__author__ = "David Antonucci"
+__version__ = "1.0.0"
+
+import argparse
+import asyncio
+import math
+import random
+import time
+from console_game import ask_for_move, get_board_size
+from console_helper import ConsoleHelper
+from tic_tac_toe import TicTacToe
+from typing import List, Tuple
+
+
+class GameClient:
+    """
+    Talks the game server's line protocol (see game_server.py)
+    """
+
+    _reader: asyncio.StreamReader
+    _writer: asyncio.StreamWriter
+
+    def __init__(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        self._reader = reader
+        self._writer = writer
+
+    @staticmethod
+    async def connect(host: str, port: int) -> "GameClient":
+        reader, writer = await asyncio.open_connection(host, port)
+        return GameClient(reader, writer)
+
+    async def close(self) -> None:
+        self._writer.write(b"QUIT\n")
+        self._writer.close()
+        try:
+            await self._writer.wait_closed()
+        except ConnectionError:
+            pass
+
+    async def read_message(self) -> List[str]:
+        """
+        Waits for the next line from the server
+        :return: The line split into its words, or an empty list if the server closed the connection
+        """
+        return (await self._reader.readline()).decode().split()
+
+    async def play(self, board_size: int) -> str:
+        """
+        Asks for a game, and waits for it to start
+        :return: The player this client is in the game (X or O)
+        """
+
+        self._send(f"PLAY {board_size}")
+        while True:
+            message = await self.read_message()
+            if not message or message[0] == "ERROR":
+                raise ConnectionError(f"Couldn't start a game: {' '.join(message)}")
+            elif message[0] == "START":
+                return message[2]
+
+    def send_move(self, move: Tuple[int, int]) -> None:
+        self._send(f"MOVE {move[0]} {move[1]}")
+
+    def _send(self, line: str) -> None:
+        self._writer.write(line.encode() + b"\n")
+
+
+async def play_interactive(host: str, port: int) -> None:
+    """
+    Plays one game against another player on the server from the console, in place of class_game.py's local loop
+    """
+
+    loop = asyncio.get_running_loop()
+    client = await GameClient.connect(host, port)
+
+    size = await loop.run_in_executor(None, get_board_size)
+    print("Waiting for an opponent...")
+    me = await client.play(size)
+    game = TicTacToe(size)  # A copy of the server's game, so the board can be drawn
+
+    try:
+        while True:
+            game.print_board_to_console()
+
+            if game.get_current_player() == me:
+                # Convert to 0-based
+                move = await loop.run_in_executor(None, ask_for_move, me)
+                client.send_move((move[0] - 1, move[1] - 1))
+            else:
+                print(f"Waiting for Player {game.get_current_player()}...")
+
+            message = await client.read_message()
+            if not message:
+                print("The server closed the connection.")
+                return
+
+            if message[0] == "ERROR":
+                print(f"The move was not allowed ({message[1]}). Please try again.")
+                continue
+
+            if message[0] == "OK":
+                game.make_move((move[0] - 1, move[1] - 1))
+                message = await client.read_message() if game.is_winner() or game.is_board_full() else message
+            elif message[0] == "MOVED":
+                game.make_move((int(message[1]), int(message[2])))
+                if game.is_winner() or game.is_board_full():
+                    message = await client.read_message()
+
+            if message[0] == "WIN":
+                game.print_board_to_console()
+                print(f"Congratulations Player {message[1]}! You Won!" if message[1] == me else
+                      f"Player {message[1]} won. Better luck next time!")
+                return
+            elif message[0] == "TIE":
+                game.print_board_to_console()
+                print("Oh no! It was a tie!")
+                return
+            elif message[0] == "ABANDONED":
+                print("Your opponent left the game.")
+                return
+    finally:
+        ConsoleHelper.reset_all_colors()
+        await client.close()
+
+
+async def _play_bot_game(host: str, port: int, board_size: int, latencies: List[float], rng: random.Random) -> None:
+    """
+    Plays one game on the server as a bot that picks random open cells, timing each move's round trip
+    """
+
+    client = await GameClient.connect(host, port)
+    try:
+        me = await client.play(board_size)
+        game = TicTacToe(board_size)  # A copy of the server's game, so the bot knows when it's over
+
+        while not game.is_winner() and not game.is_board_full():
+            if game.get_current_player() == me:
+                move = game.random_legal_move(rng)
+                start = time.perf_counter()
+                client.send_move(move)
+
+                message = await client.read_message()
+                latencies.append(time.perf_counter() - start)
+                if not message or message[0] != "OK":
+                    raise ConnectionError(f"The move {move} failed: {' '.join(message)}")
+            else:
+                message = await client.read_message()
+                if not message or message[0] == "ABANDONED":
+                    return
+
+                move = (int(message[1]), int(message[2]))
+
+            game.make_move(move)
+
+        # Read the result, so the game is over on the server too before disconnecting
+        await client.read_message()
+    finally:
+        await client.close()
+
+
+async def run_load_test(host: str, port: int, sessions: int, board_size: int, seed: int=None) -> dict:
+    """
+    Plays many games on the server at once with random-move bots
+    :param sessions: How many games to play at the same time
+    :return: The throughput and move round-trip latency percentiles
+    """
+
+    rng = random.Random(seed)
+    latencies = []
+    start = time.perf_counter()
+
+    await asyncio.gather(*(_play_bot_game(host, port, board_size, latencies, rng) for _ in range(sessions * 2)))
+
+    seconds = time.perf_counter() - start
+    latencies.sort()
+
+    def percentile(value: float) -> float:
+        return latencies[min(len(latencies) - 1, max(0, math.ceil(value / 100 * len(latencies)) - 1))]
+
+    return {
+        "sessions": sessions,
+        "seconds": seconds,
+        "sessions_per_second": sessions / seconds,
+        "moves": len(latencies),
+        "p50_ms": percentile(50) * 1000,
+        "p99_ms": percentile(99) * 1000,
+    }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Plays Tic-tac-toe on a game server")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--load", type=int, metavar="SESSIONS",
+                        help="Instead of playing, run a load test with this many concurrent bot games")
+    parser.add_argument("--size", type=int, default=3, help="The board size of the load test games")
+    args = parser.parse_args()
+
+    if args.load is None:
+        asyncio.run(play_interactive(args.host, args.port))
+    else:
+        print(asyncio.run(run_load_test(args.host, args.port, args.load, args.size)))
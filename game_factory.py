@@ -0,0 +1,22 @@
+__author__ = "David Antonucci"
+__version__ = "1.0.0"
+
+from bitboard_tic_tac_toe import BitboardTicTacToe
+from enums import GameEngine
+from tic_tac_toe import TicTacToe
+from typing import Dict, Type
+
+_ENGINES: Dict[GameEngine, Type[TicTacToe]] = {
+    GameEngine.LIST: TicTacToe,
+    GameEngine.BITBOARD: BitboardTicTacToe,
+}
+
+
+def create_game(board_size: int, engine: GameEngine=GameEngine.LIST) -> TicTacToe:
+    """
+    Creates a new game using the given engine
+    :param board_size: The size of the board
+    :param engine: Which board representation the game should use
+    :return: The new game, which has the same API no matter which engine is picked
+    """
+    return _ENGINES[engine](board_size)
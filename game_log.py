@@ -0,0 +1,293 @@
+__author__ = "David Antonucci"
+__version__ = "1.0.0"
+
+import mmap
+import os
+import struct
+import sys
+from tic_tac_toe import TicTacToe
+from typing import Iterator, NamedTuple, Optional, Tuple
+
+# Each game is a length-prefixed record, appended to the log:
+#   payload length (u32), board size (u8), winner (u8: 0 for none, otherwise 1 + the player), number of moves (u16),
+#   then each move as a cell number (u16), which is (y * board size) + x
+_LENGTH: struct.Struct = struct.Struct("<I")
+_RECORD_HEADER: struct.Struct = struct.Struct("<BBH")
+_MOVE: struct.Struct = struct.Struct("<H")
+
+# The sidecar index holds where each record starts (u64), so a game can be found by its number
+_OFFSET: struct.Struct = struct.Struct("<Q")
+INDEX_SUFFIX: str = ".idx"
+
+# How many index entries a writer holds before it flushes the log and writes them
+_INDEX_BATCH_SIZE: int = 4096
+
+
+class GameRecord(NamedTuple):
+    board_size: int
+    winner: chr  # TicTacToe.NEUTRAL_PLAYER for a tie or an unfinished game
+    moves: Tuple[Tuple[int, int], ...]
+
+    def replay(self) -> TicTacToe:
+        """
+        Plays the recorded moves on a new game
+        """
+
+        game = TicTacToe(self.board_size)
+        for move in self.moves:
+            game.make_move(move)
+
+        return game
+
+
+def encode_game(game: TicTacToe) -> bytes:
+    """
+    Encodes a game's moves and result as one log record, including its length prefix
+    """
+
+    size = game.get_board_size()
+    moves = game.get_moves()
+    winner = TicTacToe._players.index(game.get_winner()) + 1 if game.is_winner() else 0
+
+    payload = bytearray(_RECORD_HEADER.pack(size, winner, len(moves)))
+    for x, y in moves:
+        payload += _MOVE.pack((y * size) + x)
+
+    return _LENGTH.pack(len(payload)) + payload
+
+
+class GameLogWriter:
+    """
+    Appends games to a log, and their offsets to its sidecar index.
+    Index entries are held back and written in batches, each one only after the log has been flushed,
+    so the index never points past the log (even if the program dies) without a flush for every game.
+    """
+
+    def __init__(self, path: str):
+        self._log = open(path, "ab")
+        self._index = open(path + INDEX_SUFFIX, "ab")
+        self._offset = self._log.seek(0, os.SEEK_END)  # Where the next record goes
+        self._pending_offsets = bytearray()  # Index entries for records that may not have reached the log yet
+
+    def __enter__(self) -> "GameLogWriter":
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self.flush()
+        self._log.close()
+        self._index.close()
+
+    def flush(self) -> None:
+        """
+        Writes out every game written so far: the log first, and then the index entries that point into it
+        """
+
+        self._log.flush()
+        self._index.write(self._pending_offsets)
+        self._index.flush()
+        self._pending_offsets.clear()
+
+    def write_game(self, game: TicTacToe) -> None:
+        """
+        Appends a game (finished or not) to the log
+        """
+
+        record = encode_game(game)
+        self._log.write(record)
+        self._pending_offsets += _OFFSET.pack(self._offset)
+        self._offset = self._offset + len(record)
+
+        if len(self._pending_offsets) >= _INDEX_BATCH_SIZE * _OFFSET.size:
+            self.flush()
+
+
+class _Index:
+    """
+    The offsets in a memory-mapped index, which are always little-endian whatever the machine is
+    """
+
+    def __init__(self, index: mmap.mmap):
+        self._index = index
+        self._count = len(index) // _OFFSET.size  # Ignoring a partly written last entry
+
+    def __getitem__(self, game_number: int) -> int:
+        if game_number < 0:
+            game_number = game_number + self._count
+
+        if not 0 <= game_number < self._count:
+            raise IndexError("There is no game with that number in the log")
+
+        return _OFFSET.unpack_from(self._index, game_number * _OFFSET.size)[0]
+
+    def __len__(self) -> int:
+        return self._count
+
+
+class GameLogReader:
+    """
+    Reads a game log through a memory map, so games are decoded one at a time as they're asked for,
+    instead of the whole file being read in
+    """
+
+    _index: Optional[_Index]
+    _log: Optional[mmap.mmap]
+
+    def __init__(self, path: str):
+
+        self._files = []
+        self._index = None
+        self._log = self._map(path)
+
+        if os.path.exists(path + INDEX_SUFFIX):
+            index = self._map(path + INDEX_SUFFIX)
+            if index is not None:
+                self._index = _Index(index)
+
+    def __enter__(self) -> "GameLogReader":
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def __getitem__(self, game_number: int) -> GameRecord:
+        """
+        Reads a game by its number, using the index
+        :raises ValueError: If the index points to a record that is missing, cut off, or corrupt
+        """
+
+        if self._index is None:
+            raise IndexError("The game log has no index")
+
+        offset = self._index[game_number]
+        if self._log is None or offset + _LENGTH.size > len(self._log):
+            raise ValueError(f"Game {game_number} is missing from the log")
+
+        record = self._read_record(offset)[0]
+        if record is None:
+            raise ValueError(f"Game {game_number} is cut off in the log")
+
+        return record
+
+    def __iter__(self) -> Iterator[GameRecord]:
+        """
+        Reads every game in order, stopping at a partly written last record
+        :raises ValueError: If a record is corrupt
+        """
+
+        for _, record in self._scan():
+            yield record
+
+    def __len__(self) -> int:
+        if self._index is None:
+            raise TypeError("The game log has no index, so it can only be iterated")
+
+        return len(self._index)
+
+    def close(self) -> None:
+        self._index = None
+
+        for file, mapped in self._files:
+            mapped.close()
+            file.close()
+
+        self._files.clear()
+        self._log = None
+
+    def has_index(self) -> bool:
+        """
+        :return: True if games can be read by their number (and counted with len)
+        """
+        return self._index is not None
+
+    def _map(self, path: str) -> Optional[mmap.mmap]:
+        """
+        Memory-maps a file read-only. Empty files can't be mapped, so they're None.
+        """
+
+        file = open(path, "rb")
+        if os.fstat(file.fileno()).st_size == 0:
+            file.close()
+            return None
+
+        mapped = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        self._files.append((file, mapped))
+        return mapped
+
+    def _scan(self) -> Iterator[Tuple[int, GameRecord]]:
+        """
+        Walks the log's records from the start, without the index
+        :return: The offset of each record, and the record
+        """
+
+        offset = 0
+        size = 0 if self._log is None else len(self._log)
+
+        while offset + _LENGTH.size <= size:
+            record, next_offset = self._read_record(offset)
+            if record is None:
+                return
+
+            yield offset, record
+            offset = next_offset
+
+    def _read_record(self, offset: int) -> Tuple[Optional[GameRecord], int]:
+        """
+        Decodes the record at the given offset
+        :return: The record (or None if it was cut off), and the offset of the next record
+        :raises ValueError: If the record is corrupt
+        """
+
+        log = self._log
+        (length,) = _LENGTH.unpack_from(log, offset)
+        start = offset + _LENGTH.size
+        end = start + length
+
+        if end > len(log):
+            return None, end
+
+        if length < _RECORD_HEADER.size:
+            raise ValueError(f"The record at offset {offset} is corrupt")
+
+        # The moves must exactly fill the record, so a bad count can't read into the next one
+        size, winner, move_count = _RECORD_HEADER.unpack_from(log, start)
+        if (length != _RECORD_HEADER.size + (move_count * _MOVE.size) or size == 0 or
+                winner > len(TicTacToe._players)):
+            raise ValueError(f"The record at offset {offset} is corrupt")
+
+        cells = struct.unpack_from(f"<{move_count}H", log, start + _RECORD_HEADER.size)
+        moves = tuple((cell % size, cell // size) for cell in cells)
+
+        return GameRecord(size, TicTacToe._players[winner - 1] if winner else TicTacToe.NEUTRAL_PLAYER, moves), end
+
+
+def rebuild_index(path: str) -> int:
+    """
+    Writes a new sidecar index for a log, such as one whose index was lost
+    :return: How many games the log holds
+    """
+
+    with GameLogReader(path) as reader:
+        offsets = [offset for offset, _ in reader._scan()]
+
+    with open(path + INDEX_SUFFIX, "wb") as index:
+        for offset in offsets:
+            index.write(_OFFSET.pack(offset))
+
+    return len(offsets)
+
+
+if __name__ == "__main__":
+    if len(sys.argv) < 2:
+        print(f"Usage: {sys.argv[0]} <game log> [--reindex]")
+        sys.exit(1)
+
+    if "--reindex" in sys.argv[2:]:
+        print(f"Indexed {rebuild_index(sys.argv[1])} games")
+    else:
+        with GameLogReader(sys.argv[1]) as game_log:
+            for number, game_record in enumerate(game_log):
+                print(f"{number}: {game_record.board_size}x{game_record.board_size} "
+                      f"winner={game_record.winner!r} moves={list(game_record.moves)}")
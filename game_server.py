@@ -0,0 +1,249 @@
+__author__ = "David Antonucci"
+__version__ = "1.0.0"
+
+import argparse
+import asyncio
+from enums import MoveError
+from game_log import GameLogWriter
+from tic_tac_toe import TicTacToe
+from typing import Dict, List, Optional
+
+# The server speaks a line protocol. Coordinates are 0-based (x, y), like TicTacToe.make_move.
+#
+# Client to server:
+#   PLAY <size>         Wait for an opponent on a board of the given size
+#   MOVE <x> <y>        Make a move in the current game
+#   QUIT                Close the connection
+#
+# Server to client:
+#   WAIT                Waiting for an opponent
+#   START <size> <X|O>  A game started, and this is the player you are
+#   OK                  Your move was made
+#   ERROR <reason>      The command failed. The reason is a MoveError name, or one of the _ERROR_* values below.
+#   MOVED <x> <y>       Your opponent made a move
+#   WIN <player> <x1> <y1> <x2> <y2>    The game was won, along the given win edges
+#   TIE                 The game was a tie
+#   ABANDONED           Your opponent left the game
+
+MIN_BOARD_SIZE: int = 2
+MAX_BOARD_SIZE: int = 10
+
+_ERROR_BAD_COMMAND: str = "BAD_COMMAND"
+_ERROR_NOT_IN_GAME: str = "NOT_IN_GAME"
+_ERROR_NOT_YOUR_TURN: str = "NOT_YOUR_TURN"
+_ERROR_ALREADY_PLAYING: str = "ALREADY_PLAYING"
+
+
+class _Connection:
+    __slots__ = ("player", "session", "writer")
+
+    def __init__(self, writer: asyncio.StreamWriter):
+        self.player = None  # The character this connection plays as in its session
+        self.session = None
+        self.writer = writer
+
+    def send(self, line: str) -> None:
+        # Writes are buffered by the transport, so there is no need to wait for each one
+        self.writer.write(line.encode() + b"\n")
+
+
+class _Session:
+    __slots__ = ("connections", "game")
+
+    def __init__(self, game: TicTacToe, connections: List[_Connection]):
+        self.connections = connections  # In player order, so the first one is X
+        self.game = game
+
+
+class GameServer:
+    """
+    Hosts many concurrent TicTacToe games over TCP from one asyncio event loop. Players are paired up
+    by board size, every move is checked by the game's make_move, and each move is pushed to the opponent.
+    """
+
+    _game_log: Optional[GameLogWriter]
+    _games_finished: int
+    _moves: int
+    _server: Optional[asyncio.AbstractServer]
+    _sessions: int
+    _waiting: Dict[int, _Connection]
+
+    def __init__(self, game_log: Optional[GameLogWriter]=None):
+        self._game_log = game_log  # Where finished and abandoned games are recorded, if anywhere
+        self._games_finished = 0
+        self._moves = 0
+        self._server = None
+        self._sessions = 0
+        self._waiting = {}  # The connection waiting for an opponent, for each board size
+
+    async def start(self, host: str="127.0.0.1", port: int=0) -> int:
+        """
+        Starts listening for connections
+        :param port: The port to listen on, or 0 to pick a free one
+        :return: The port being listened on
+        """
+
+        self._server = await asyncio.start_server(self._handle_client, host, port)
+        return self._server.sockets[0].getsockname()[1]
+
+    async def close(self) -> None:
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+
+    def get_stats(self) -> Dict[str, int]:
+        """
+        Gets how many games are being played, how many have finished, and how many moves have been made
+        """
+        return {"active_sessions": self._sessions, "games_finished": self._games_finished, "moves": self._moves}
+
+    async def _handle_client(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        connection = _Connection(writer)
+
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+
+                command = line.decode(errors="replace").split()
+                if command and command[0].upper() == "QUIT":
+                    break
+
+                self._handle_command(connection, command)
+                await writer.drain()
+
+        except ConnectionError:
+            pass
+
+        finally:
+            self._disconnect(connection)
+            writer.close()
+
+    def _handle_command(self, connection: _Connection, command: List[str]) -> None:
+        name = command[0].upper() if command else ""
+        arguments = command[1:]
+
+        if name == "PLAY" and len(arguments) == 1 and arguments[0].isdecimal():
+            self._play(connection, int(arguments[0]))
+        elif name == "MOVE" and len(arguments) == 2 and all(argument.isdecimal() for argument in arguments):
+            self._move(connection, int(arguments[0]), int(arguments[1]))
+        else:
+            connection.send(f"ERROR {_ERROR_BAD_COMMAND}")
+
+    def _disconnect(self, connection: _Connection) -> None:
+        """
+        Takes a connection out of matchmaking, and ends its game if it was in one
+        """
+
+        for size, waiting in list(self._waiting.items()):
+            if waiting is connection:
+                del self._waiting[size]
+
+        if connection.session is not None:
+            for other in connection.session.connections:
+                if other is not connection:
+                    other.send("ABANDONED")
+            self._end_session(connection.session)
+
+    def _end_session(self, session: _Session) -> None:
+        for connection in session.connections:
+            connection.session = None
+            connection.player = None
+
+        self._sessions = self._sessions - 1
+        self._games_finished = self._games_finished + 1
+
+        if self._game_log is not None:
+            self._game_log.write_game(session.game)
+
+    def _move(self, connection: _Connection, x: int, y: int) -> None:
+        session = connection.session
+        if session is None:
+            connection.send(f"ERROR {_ERROR_NOT_IN_GAME}")
+            return
+
+        game = session.game
+        if game.get_current_player() != connection.player:
+            connection.send(f"ERROR {_ERROR_NOT_YOUR_TURN}")
+            return
+
+        result = game.make_move((x, y))
+        if result != MoveError.OKAY:
+            connection.send(f"ERROR {result.name}")
+            return
+
+        self._moves = self._moves + 1
+        connection.send("OK")
+        for other in session.connections:
+            if other is not connection:
+                other.send(f"MOVED {x} {y}")
+
+        if game.is_winner():
+            (x1, y1), (x2, y2) = game.get_win_edges()
+            result_line = f"WIN {game.get_winner()} {x1} {y1} {x2} {y2}"
+        elif game.is_board_full():
+            result_line = "TIE"
+        else:
+            return
+
+        for player in session.connections:
+            player.send(result_line)
+        self._end_session(session)
+
+    def _play(self, connection: _Connection, size: int) -> None:
+        if connection.session is not None or connection in self._waiting.values():
+            connection.send(f"ERROR {_ERROR_ALREADY_PLAYING}")
+            return
+
+        if size < MIN_BOARD_SIZE or size > MAX_BOARD_SIZE:
+            connection.send(f"ERROR {MoveError.OUT_OF_RANGE.name}")
+            return
+
+        opponent = self._waiting.pop(size, None)
+        if opponent is None:
+            self._waiting[size] = connection
+            connection.send("WAIT")
+            return
+
+        # Whoever was waiting goes first
+        game = TicTacToe(size)
+        session = _Session(game, [opponent, connection])
+        self._sessions = self._sessions + 1
+
+        for player, player_connection in zip(("X", "O"), session.connections):
+            player_connection.session = session
+            player_connection.player = player
+            player_connection.send(f"START {size} {player}")
+
+
+async def _serve(host: str, port: int, log_path: Optional[str]) -> None:
+    game_log = None if log_path is None else GameLogWriter(log_path)
+    server = GameServer(game_log)
+    port = await server.start(host, port)
+    print(f"Listening on {host}:{port}")
+
+    try:
+        while True:
+            await asyncio.sleep(10)
+            print(server.get_stats())
+            if game_log is not None:
+                game_log.flush()
+    finally:
+        await server.close()
+        if game_log is not None:
+            game_log.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Hosts Tic-tac-toe games over TCP")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--log", help="A game log to append every game to")
+    args = parser.parse_args()
+
+    try:
+        asyncio.run(_serve(args.host, args.port, args.log))
+    except KeyboardInterrupt:
+        pass
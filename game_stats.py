@@ -0,0 +1,208 @@
+__author__ = "David Antonucci"
+__version__ = "1.0.0"
+
+import argparse
+import time
+from collections import Counter
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from game_log import GameLogReader, GameRecord
+from typing import Dict, Iterable, List, Optional, Tuple
+
+# How many games each worker process replays at a time
+DEFAULT_CHUNK_SIZE: int = 50000
+
+# How many moves from the start of a game count as its opening
+DEFAULT_OPENING_LENGTH: int = 3
+
+_FIRST_PLAYER: chr = 'X'
+
+
+class GameStats:
+    """
+    Aggregate statistics over replayed games. Everything is a count, so the statistics of separate
+    chunks of games can be merged into the statistics of all of them.
+    """
+
+    games: Counter  # board size -> games
+    first_player_wins: Counter  # board size -> games won by the first player
+    second_player_wins: Counter  # board size -> games won by the second player
+    game_lengths: Counter  # (board size, number of moves) -> games
+    openings: Counter  # (board size, first moves) -> games
+    win_lines: Counter  # (board size, win edges) -> games won along that line
+
+    def __init__(self, opening_length: int=DEFAULT_OPENING_LENGTH):
+        self.opening_length = opening_length  # How many moves of each game are counted as its opening
+
+        self.games = Counter()
+        self.first_player_wins = Counter()
+        self.second_player_wins = Counter()
+        self.game_lengths = Counter()
+        self.openings = Counter()
+        self.win_lines = Counter()
+
+    def add_game(self, record: GameRecord) -> None:
+        """
+        Replays a game and counts it
+        """
+
+        size = record.board_size
+        game = record.replay()
+
+        self.games[size] += 1
+        self.game_lengths[size, len(record.moves)] += 1
+
+        if len(record.moves) >= self.opening_length:
+            self.openings[size, record.moves[:self.opening_length]] += 1
+
+        if game.is_winner():
+            if game.get_winner() == _FIRST_PLAYER:
+                self.first_player_wins[size] += 1
+            else:
+                self.second_player_wins[size] += 1
+
+            self.win_lines[size, tuple(game.get_win_edges())] += 1
+
+    def add_games(self, records: Iterable[GameRecord]) -> None:
+        for record in records:
+            self.add_game(record)
+
+    def merge(self, other: "GameStats") -> None:
+        """
+        Adds the counts of another set of statistics (with the same opening length) to these
+        """
+
+        if other.opening_length != self.opening_length:
+            raise ValueError("Statistics with different opening lengths can't be merged")
+
+        self.games.update(other.games)
+        self.first_player_wins.update(other.first_player_wins)
+        self.second_player_wins.update(other.second_player_wins)
+        self.game_lengths.update(other.game_lengths)
+        self.openings.update(other.openings)
+        self.win_lines.update(other.win_lines)
+
+    def get_board_sizes(self) -> List[int]:
+        return sorted(self.games)
+
+    def get_first_player_win_rate(self, board_size: int) -> float:
+        """
+        Gets the fraction of the games on a board size that were won by the player who went first
+        """
+
+        games = self.games[board_size]
+        return self.first_player_wins[board_size] / games if games else 0.0
+
+    def get_game_lengths(self, board_size: int) -> Dict[int, int]:
+        """
+        Gets how many games on a board size lasted each number of moves
+        """
+
+        return {length: count for (size, length), count in sorted(self.game_lengths.items()) if size == board_size}
+
+    def get_most_common_openings(self, board_size: int, count: int=10) -> List[Tuple[Tuple[Tuple[int, int], ...], int]]:
+        """
+        Gets the openings played most on a board size, with how many games started with them
+        """
+
+        openings = Counter({moves: games for (size, moves), games in self.openings.items() if size == board_size})
+        return openings.most_common(count)
+
+    def get_win_lines(self, board_size: int) -> List[Tuple[Tuple[Tuple[int, int], Tuple[int, int]], int]]:
+        """
+        Gets how many games on a board size were won along each line, most common first
+        """
+
+        lines = Counter({edges: games for (size, edges), games in self.win_lines.items() if size == board_size})
+        return lines.most_common()
+
+
+def _read_chunk(path: str, first_game: int, number_of_games: int, opening_length: int) -> GameStats:
+    """
+    Counts one chunk of a game log. Each worker maps the log itself, so only the statistics are sent back.
+    """
+
+    stats = GameStats(opening_length)
+    with GameLogReader(path) as reader:
+        stats.add_games(reader[game_number] for game_number in range(first_game, first_game + number_of_games))
+
+    return stats
+
+
+def analyze_log(path: str, workers: int=1, chunk_size: int=DEFAULT_CHUNK_SIZE,
+                opening_length: int=DEFAULT_OPENING_LENGTH) -> GameStats:
+    """
+    Computes statistics over every game in a log, streaming through it so memory doesn't grow with the log
+    :param path: The game log (see game_log.py)
+    :param workers: How many processes to spread the chunks across. This needs the log's index.
+    :param chunk_size: How many games are in each chunk given to a worker
+    :param opening_length: How many moves of each game are counted as its opening
+    :return: The statistics of all the games
+    """
+
+    stats = GameStats(opening_length)
+
+    with GameLogReader(path) as reader:
+        if workers <= 1 or not reader.has_index():
+            stats.add_games(reader)
+            return stats
+
+        number_of_games = len(reader)
+
+    chunks = iter(range(0, number_of_games, chunk_size))
+
+    with ProcessPoolExecutor(workers) as executor:
+        # Only keep a couple of chunks per worker in flight, and merge each one as soon as it's done
+        pending = set()
+        for first in chunks:
+            pending.add(executor.submit(_read_chunk, path, first, min(chunk_size, number_of_games - first),
+                                        opening_length))
+
+            if len(pending) >= workers * 2:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    stats.merge(future.result())
+
+        for future in pending:
+            stats.merge(future.result())
+
+    return stats
+
+
+def print_report(stats: GameStats, top: int=5, seconds: Optional[float]=None) -> None:
+    """
+    Prints the statistics for each board size
+    """
+
+    for size in stats.get_board_sizes():
+        games = stats.games[size]
+        print(f"{size}x{size}: {games:,} games, X won {stats.get_first_player_win_rate(size):.1%}, "
+              f"O won {stats.second_player_wins[size] / games:.1%}")
+
+        lengths = stats.get_game_lengths(size)
+        print("  Game lengths: " + ", ".join(f"{length}: {count:,}" for length, count in lengths.items()))
+
+        print("  Most common openings:")
+        for moves, count in stats.get_most_common_openings(size, top):
+            print(f"    {' '.join(f'({x + 1}, {y + 1})' for x, y in moves)}: {count:,}")
+
+        print("  Winning lines:")
+        for ((x1, y1), (x2, y2)), count in stats.get_win_lines(size)[:top]:
+            print(f"    ({x1 + 1}, {y1 + 1}) to ({x2 + 1}, {y2 + 1}): {count:,}")
+
+    if seconds is not None:
+        total = sum(stats.games.values())
+        print(f"\n{total:,} games in {seconds:.2f}s ({total / seconds if seconds > 0 else 0.0:,.0f} games/s)")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Reports statistics over the games in a game log")
+    parser.add_argument("log")
+    parser.add_argument("--workers", type=int, default=1)
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE)
+    parser.add_argument("--opening-length", type=int, default=DEFAULT_OPENING_LENGTH)
+    parser.add_argument("--top", type=int, default=5, help="How many openings and lines to show")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    log_stats = analyze_log(args.log, args.workers, args.chunk_size, args.opening_length)
+    print_report(log_stats, args.top, time.perf_counter() - start)
@@ -3,10 +3,13 @@ __version__ = "1.0.0"
 
 import re
 import sys
+import profiling
 from PyQt5.QtWidgets import *
 from qt_gui import QtGui
 
 if __name__ == "__main__":
+    profiling.enable_from_environment()
+
     board_size = 3
 
     if len(sys.argv) > 1 and re.match("^\d+$", sys.argv[1]) is not None:
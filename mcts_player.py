@@ -0,0 +1,219 @@
+__author__ = "David Antonucci"
+__version__ = "1.0.0"
+
+import math
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+from tic_tac_toe import TicTacToe
+from typing import Callable, Dict, List, NamedTuple, Optional, Tuple
+
+
+class SearchStats(NamedTuple):
+    playouts: int
+    seconds: float
+    workers: int
+
+    @property
+    def playouts_per_second(self) -> float:
+        return self.playouts / self.seconds if self.seconds > 0 else 0.0
+
+
+class _Node:
+    """
+    A node of the search tree. Its wins are counted for the player who made the move that leads to it.
+    """
+
+    __slots__ = ("children", "move", "parent", "player", "untried_moves", "visits", "wins")
+
+    def __init__(self, parent: Optional["_Node"], move: Optional[Tuple[int, int]], player: chr,
+                 untried_moves: List[Tuple[int, int]]):
+
+        self.children = []
+        self.move = move
+        self.parent = parent
+        self.player = player
+        self.untried_moves = untried_moves
+        self.visits = 0
+        self.wins = 0.0
+
+    def select_child(self, exploration: float) -> "_Node":
+        """
+        Picks the child with the best UCT score
+        """
+
+        log_visits = math.log(self.visits)
+        return max(self.children,
+                   key=lambda child: (child.wins / child.visits) + exploration * math.sqrt(log_visits / child.visits))
+
+
+def _search(game: TicTacToe, iterations: Optional[int], time_limit: Optional[float], exploration: float,
+            seed: Optional[int], should_stop: Callable[[], bool]=None,
+            progress: Callable[[Tuple[int, int], int], None]=None) -> Tuple[Dict[Tuple[int, int], int], int]:
+    """
+    Builds one search tree from the given game
+    :param should_stop: Checked every so often; once it returns True the search ends early
+    :param progress: Called every so often with the most visited move so far and how many playouts have been run
+    :return: How many times each root move was visited, and how many playouts were run
+    """
+
+    rng = random.Random(seed)
+    deadline = None if time_limit is None else time.perf_counter() + time_limit
+
+    # The root's player is whoever moved last, so its children are scored for the player to move
+    root = _Node(None, None, None, list(game.legal_moves()))
+    rng.shuffle(root.untried_moves)
+    playouts = 0
+
+    while (iterations is None or playouts < iterations) and (deadline is None or time.perf_counter() < deadline):
+        node = root
+        state = game.copy()
+
+        # Selection
+        while not node.untried_moves and node.children:
+            node = node.select_child(exploration)
+            state.make_move(node.move)
+
+        # Expansion
+        if node.untried_moves and not state.is_winner():
+            move = node.untried_moves.pop()
+            player = state.get_current_player()
+            state.make_move(move)
+
+            # The open cells after the move are the parent's untried moves plus the ones it already expanded
+            untried_moves = []
+            if not state.is_winner():
+                untried_moves = node.untried_moves + [child.move for child in node.children]
+                rng.shuffle(untried_moves)
+
+            child = _Node(node, move, player, untried_moves)
+            node.children.append(child)
+            node = child
+
+        # Playout, with the open cells in a random order
+        if not state.is_winner() and not state.is_board_full():
+            moves = list(state.legal_moves())
+            rng.shuffle(moves)
+            for move in moves:
+                state.make_move(move)
+                if state.is_winner():
+                    break
+
+        winner = state.get_winner()
+        playouts = playouts + 1
+
+        # Back propagation
+        while node is not None:
+            node.visits = node.visits + 1
+            if winner == TicTacToe.NEUTRAL_PLAYER:
+                node.wins = node.wins + 0.5
+            elif winner == node.player:
+                node.wins = node.wins + 1
+            node = node.parent
+
+        if playouts & 255 == 0:
+            if should_stop is not None and should_stop():
+                break
+
+            if progress is not None:
+                progress(max(root.children, key=lambda child: child.visits).move, playouts)
+
+    return {child.move: child.visits for child in root.children}, playouts
+
+
+class MctsPlayer:
+    """
+    A computer player that picks its move with Monte Carlo Tree Search using UCT selection.
+    With more than one worker, each worker process grows its own tree from the root, and the root
+    visit counts of all of them are added together to pick the move.
+    """
+
+    _executor: Optional[ProcessPoolExecutor]
+    _exploration: float
+    _iterations: Optional[int]
+    _last_stats: Optional[SearchStats]
+    _rng: random.Random
+    _time_limit: Optional[float]
+    _workers: int
+
+    def __init__(self, time_limit: float=None, iterations: int=None, workers: int=1, exploration: float=1.4,
+                 seed: int=None):
+        """
+        :param time_limit: The most seconds a move may take
+        :param iterations: The most playouts each worker may run
+        :param workers: How many processes to spread the root-parallel trees across
+        :param exploration: The UCT exploration constant
+        :param seed: Seeds the random playouts, so searches can be repeated
+        """
+
+        if time_limit is None and iterations is None:
+            raise ValueError("Either a time limit or a number of iterations must be given")
+
+        self._executor = None
+        self._exploration = exploration
+        self._iterations = iterations
+        self._last_stats = None
+        self._rng = random.Random(seed)
+        self._time_limit = time_limit
+        self._workers = workers
+
+    def choose_move(self, game: TicTacToe, should_stop: Callable[[], bool]=None,
+                    progress: Callable[[Tuple[int, int], int], None]=None) -> Optional[Tuple[int, int]]:
+        """
+        Picks the move for the player whose turn it is
+        :param game: The game to pick a move in. It is not modified.
+        :param should_stop: Checked every so often; once it returns True the search ends early (single worker only)
+        :param progress: Called every so often with the best move so far and how many playouts have been run
+                         (single worker only)
+        :return: The 0-based (x, y) coordinates of the move, or None if the game is already over
+        """
+
+        if game.is_winner() or game.is_board_full():
+            return None
+
+        start = time.perf_counter()
+        seeds = [self._rng.getrandbits(32) for _ in range(self._workers)]
+
+        if self._workers == 1:
+            results = [_search(game, self._iterations, self._time_limit, self._exploration, seeds[0], should_stop,
+                               progress)]
+        else:
+            if self._executor is None:
+                self._executor = ProcessPoolExecutor(self._workers)
+
+            futures = [self._executor.submit(_search, game, self._iterations, self._time_limit, self._exploration,
+                                             seed)
+                       for seed in seeds]
+            results = [future.result() for future in futures]
+
+        # Merge the trees by adding up how often each of the root's moves was visited
+        visits = {}
+        for root_visits, _ in results:
+            for move, count in root_visits.items():
+                visits[move] = visits.get(move, 0) + count
+
+        self._last_stats = SearchStats(sum(playouts for _, playouts in results), time.perf_counter() - start,
+                                       self._workers)
+
+        return max(visits, key=visits.get)
+
+    def close(self) -> None:
+        """
+        Shuts down the worker processes, if any were started
+        """
+
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+    def get_search_stats(self) -> Optional[SearchStats]:
+        """
+        Gets how many playouts the last call to choose_move ran, and how long it took
+        """
+        return self._last_stats
+
+    def reseed(self, seed: int) -> None:
+        """
+        Restarts the player's random playouts from the given seed
+        """
+        self._rng.seed(seed)
@@ -0,0 +1,332 @@
+__author__ = "David Antonucci"
+__version__ = "1.0.0"
+
+import time
+from bitboard_tic_tac_toe import get_cell_win_masks, get_win_masks
+from opening_book import OpeningBook
+from symmetry import canonicalize_bitboards, get_inverse_symmetries, get_player_bitboards, get_symmetries
+from tic_tac_toe import TicTacToe
+from typing import Callable, Dict, List, Optional, Tuple
+
+# Scores are from the point of view of the player to move. A win is worth _WIN_SCORE minus how many
+# plies away from the root it happens, so that quicker wins (and slower losses) are preferred.
+_WIN_SCORE: int = 1000000
+_WIN_BOUND: int = _WIN_SCORE - 1000
+
+# Transposition table entry flags
+_EXACT: int = 0
+_LOWER_BOUND: int = 1
+_UPPER_BOUND: int = 2
+
+# A transposition table entry is (depth, value, flag, best move in canonical cell numbering)
+TableEntry = Tuple[int, int, int, int]
+
+
+class _SearchTimeout(Exception):
+    pass
+
+
+def _count_bits(bitboard: int) -> int:
+    return bin(bitboard).count("1")
+
+
+class MinimaxPlayer:
+    """
+    A computer player that picks its move with a negamax search using alpha-beta pruning.
+    Positions are cached in a transposition table under their canonical form, so all 8 rotations
+    and reflections of a board share one entry.
+    """
+
+    _board_size: int
+    _cell_lines: Tuple[Tuple[int, ...], ...]
+    _cell_order: List[int]
+    _deadline: Optional[float]
+    _inverse_symmetries: Tuple[Tuple[int, ...], ...]
+    _max_depth: Optional[int]
+    _nodes: int
+    _opening_book: Optional[OpeningBook]
+    _should_stop: Optional[Callable[[], bool]]
+    _symmetries: Tuple[Tuple[int, ...], ...]
+    _time_limit: Optional[float]
+    _transposition_tables: Dict[int, Dict[int, TableEntry]]
+    _win_masks: Tuple[int, ...]
+
+    def __init__(self, time_limit: float=None, max_depth: int=None, opening_book: OpeningBook=None):
+        """
+        :param time_limit: The most seconds a move may take, or None to always search until the game is solved
+        :param max_depth: The deepest the search may go, or None for no limit
+        :param opening_book: A book to play the first moves from instead of searching them, if any
+        """
+
+        self._board_size = 0
+        self._deadline = None
+        self._max_depth = max_depth
+        self._nodes = 0
+        self._opening_book = opening_book
+        self._should_stop = None
+        self._time_limit = time_limit
+        self._transposition_tables = {}  # One per board size, so they can be kept between games
+
+    def choose_move(self, game: TicTacToe, should_stop: Callable[[], bool]=None,
+                    progress: Callable[[Tuple[int, int], int], None]=None) -> Optional[Tuple[int, int]]:
+        """
+        Picks the best move for the player whose turn it is
+        :param game: The game to pick a move in. It is not modified.
+        :param should_stop: Checked every so often; once it returns True the search ends early
+        :param progress: Called after each finished depth with the best move so far and the positions looked at
+        :return: The 0-based (x, y) coordinates of the move, or None if the game is already over
+        """
+
+        if game.is_winner() or game.is_board_full():
+            return None
+
+        if self._opening_book is not None:
+            move = self._opening_book.choose_move(game)
+            if move is not None:
+                self._nodes = 0
+                return move
+
+        self._set_board_size(game.get_board_size())
+
+        # Read the board into bitboards for the player to move and their opponent
+        first, second = get_player_bitboards(game)
+        mine, theirs = (first, second) if game.get_current_player() == 'X' else (second, first)
+
+        open_cells = (self._board_size ** 2) - _count_bits(mine | theirs)
+        max_depth = open_cells if self._max_depth is None else min(self._max_depth, open_cells)
+
+        self._deadline = None if self._time_limit is None else time.perf_counter() + self._time_limit
+        self._nodes = 0
+        self._should_stop = should_stop
+
+        # Iterative deepening, so there is always a move from the last finished depth if time runs out
+        best_cell = self._get_ordered_moves(mine, theirs, -1)[0]
+        for depth in range(1, max_depth + 1):
+            try:
+                value, cell = self._search_root(mine, theirs, depth)
+            except _SearchTimeout:
+                break
+
+            best_cell = cell
+            if progress is not None:
+                progress((best_cell % self._board_size, best_cell // self._board_size), self._nodes)
+
+            # Once the result is a forced win or loss, looking deeper won't change it
+            if abs(value) >= _WIN_BOUND:
+                break
+
+        return best_cell % self._board_size, best_cell // self._board_size
+
+    def get_nodes_searched(self) -> int:
+        """
+        Gets how many positions the last call to choose_move looked at
+        """
+        return self._nodes
+
+    def _evaluate(self, mine: int, theirs: int) -> int:
+        """
+        Scores a position that the search didn't reach the end of, by how far along each player's open lines are
+        """
+
+        score = 0
+        for mask in self._win_masks:
+            my_cells = mine & mask
+            their_cells = theirs & mask
+
+            if my_cells and not their_cells:
+                score += 1 << (2 * _count_bits(my_cells))
+            elif their_cells and not my_cells:
+                score -= 1 << (2 * _count_bits(their_cells))
+
+        return score
+
+    def _get_ordered_moves(self, mine: int, theirs: int, first_cell: int) -> List[int]:
+        """
+        Gets the open cells, with the most promising ones first so alpha-beta can cut off sooner
+        :param first_cell: A cell to try before all others (such as the transposition table's best move), or -1
+        """
+
+        taken = mine | theirs
+        wins = []
+        blocks = []
+        others = []
+
+        for cell in self._cell_order:
+            bit = 1 << cell
+            if taken & bit:
+                continue
+
+            if cell == first_cell:
+                continue
+
+            if self._is_winning_move(mine | bit, cell):
+                wins.append(cell)
+            elif self._is_winning_move(theirs | bit, cell):
+                blocks.append(cell)
+            else:
+                others.append(cell)
+
+        if first_cell >= 0:
+            return wins + [first_cell] + blocks + others
+
+        return wins + blocks + others
+
+    def _is_winning_move(self, bitboard: int, cell: int) -> bool:
+        """
+        Checks if any line through the given cell is full in the bitboard
+        """
+
+        for mask in self._cell_lines[cell]:
+            if bitboard & mask == mask:
+                return True
+
+        return False
+
+    def _negamax(self, mine: int, theirs: int, last_cell: int, depth: int, alpha: int, beta: int, ply: int) -> int:
+        """
+        Scores the position for the player to move
+        :param mine: The cells of the player to move
+        :param theirs: The cells of the player who just moved
+        :param last_cell: The cell the opponent just played
+        :param depth: How many more plies may be searched
+        :param alpha: The score the player to move is already guaranteed
+        :param beta: The score the opponent is already guaranteed
+        :param ply: How many plies this position is from the root
+        """
+
+        self._nodes += 1
+        if self._nodes & 1023 == 0 and ((self._deadline is not None and time.perf_counter() > self._deadline) or
+                                        (self._should_stop is not None and self._should_stop())):
+            raise _SearchTimeout()
+
+        if self._is_winning_move(theirs, last_cell):
+            return -(_WIN_SCORE - ply)
+
+        open_cells = (self._board_size ** 2) - _count_bits(mine | theirs)
+        if open_cells == 0:
+            return 0
+
+        if depth == 0:
+            return self._evaluate(mine, theirs)
+
+        # The result is exact once the search can reach the end of the game, so cap the depth there
+        # to let deeper searches reuse it
+        depth = min(depth, open_cells)
+        original_alpha = alpha
+
+        key, symmetry = canonicalize_bitboards(mine, theirs, self._board_size)
+        table = self._transposition_tables[self._board_size]
+        entry = table.get(key)
+        first_cell = -1
+
+        if entry is not None:
+            entry_depth, value, flag, canonical_cell = entry
+            first_cell = self._inverse_symmetries[symmetry][canonical_cell]
+
+            if entry_depth >= depth:
+                value = self._from_table_value(value, ply)
+                if flag == _EXACT:
+                    return value
+                elif flag == _LOWER_BOUND:
+                    alpha = max(alpha, value)
+                else:
+                    beta = min(beta, value)
+
+                if alpha >= beta:
+                    return value
+
+        best_value = None
+        best_cell = first_cell
+
+        for cell in self._get_ordered_moves(mine, theirs, first_cell):
+            value = -self._negamax(theirs, mine | (1 << cell), cell, depth - 1, -beta, -alpha, ply + 1)
+
+            if best_value is None or value > best_value:
+                best_value = value
+                best_cell = cell
+
+            alpha = max(alpha, value)
+            if alpha >= beta:
+                break
+
+        if best_value <= original_alpha:
+            flag = _UPPER_BOUND
+        elif best_value >= beta:
+            flag = _LOWER_BOUND
+        else:
+            flag = _EXACT
+
+        table[key] = (depth, self._to_table_value(best_value, ply), flag, self._symmetries[symmetry][best_cell])
+
+        return best_value
+
+    def _search_root(self, mine: int, theirs: int, depth: int) -> Tuple[int, int]:
+        """
+        Searches every move of the root position to the given depth
+        :return: The best score, and the cell that gets it
+        """
+
+        alpha = -_WIN_SCORE - 1
+        beta = _WIN_SCORE + 1
+        best_cell = -1
+
+        key, symmetry = canonicalize_bitboards(mine, theirs, self._board_size)
+        entry = self._transposition_tables[self._board_size].get(key)
+        first_cell = -1 if entry is None else self._inverse_symmetries[symmetry][entry[3]]
+
+        for cell in self._get_ordered_moves(mine, theirs, first_cell):
+            value = -self._negamax(theirs, mine | (1 << cell), cell, depth - 1, -beta, -alpha, 1)
+
+            if value > alpha:
+                alpha = value
+                best_cell = cell
+
+        self._transposition_tables[self._board_size][key] = (
+            min(depth, (self._board_size ** 2) - _count_bits(mine | theirs)),
+            self._to_table_value(alpha, 0), _EXACT, self._symmetries[symmetry][best_cell])
+
+        return alpha, best_cell
+
+    def _set_board_size(self, board_size: int) -> None:
+        """
+        Sets up the tables the search uses for the given board size
+        """
+
+        if board_size == self._board_size:
+            return
+
+        self._board_size = board_size
+        self._cell_lines = get_cell_win_masks(board_size)
+        self._inverse_symmetries = get_inverse_symmetries(board_size)
+        self._symmetries = get_symmetries(board_size)
+        self._win_masks = get_win_masks(board_size)
+        self._transposition_tables.setdefault(board_size, {})
+
+        # Try the cells on the most lines first (the center and diagonals on odd boards)
+        self._cell_order = sorted(range(board_size ** 2), key=lambda cell: -len(self._cell_lines[cell]))
+
+    @staticmethod
+    def _from_table_value(value: int, ply: int) -> int:
+        """
+        Converts a score stored relative to its position back to one relative to the root
+        """
+
+        if value >= _WIN_BOUND:
+            return value - ply
+        elif value <= -_WIN_BOUND:
+            return value + ply
+
+        return value
+
+    @staticmethod
+    def _to_table_value(value: int, ply: int) -> int:
+        """
+        Converts a score relative to the root to one relative to its position, so it is correct wherever it's reused
+        """
+
+        if value >= _WIN_BOUND:
+            return value + ply
+        elif value <= -_WIN_BOUND:
+            return value - ply
+
+        return value
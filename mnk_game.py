@@ -0,0 +1,169 @@
+__author__ = "David Antonucci"
+__version__ = "1.0.0"
+
+from enums import Color, MoveError
+from tic_tac_toe import TicTacToe
+from typing import Dict, List, Optional, Tuple
+
+# The four directions a line can run in: horizontal, vertical, backward diagonal (\), and forward diagonal (/)
+_DIRECTIONS: Tuple[Tuple[int, int], ...] = ((1, 0), (0, 1), (1, 1), (-1, 1))
+
+
+class MnkGame:
+    """
+    A k-in-a-row game on an m x n board, like Gomoku. Any k cells in a row, column, or diagonal win,
+    not only complete lines. Only the played cells are stored, and a move only checks the cells within
+    k - 1 of itself, so a move costs the same no matter how big the board is.
+    """
+
+    _cells: Dict[Tuple[int, int], int]
+    _current_player: int
+    _height: int
+    _last_move: Optional[Tuple[int, int]]
+    _players: List[chr]
+    _player_colors: Dict[int, Color]
+    _win_length: int
+    _width: int
+    _winner: chr
+    _win_edges: Tuple[Tuple[int, int], Tuple[int, int]]
+
+    def __init__(self, width: int, height: int, win_length: int):
+        """
+        :param width: The number of columns (m)
+        :param height: The number of rows (n)
+        :param win_length: How many in a row are needed to win (k)
+        """
+
+        if width < 1 or height < 1 or win_length < 1:
+            raise ValueError("The board size and win length must be at least 1")
+
+        self._cells = {}  # (x, y) -> index of the player in the cell. Open cells aren't stored.
+        self._current_player = 0
+        self._height = height
+        self._last_move = None
+        self._players = ['X', 'O']
+        self._player_colors = {0: Color.GREEN, 1: Color.YELLOW}
+        self._win_length = win_length
+        self._width = width
+        self._winner = TicTacToe.NEUTRAL_PLAYER
+        self._win_edges = ((0, 0), (0, 0))
+
+    def is_board_full(self) -> bool:
+        return len(self._cells) == self._width * self._height
+
+    def is_winner(self) -> bool:
+        """
+        Checks if somebody has won the game
+        :return: True if there is a winner
+        """
+        return self._winner != TicTacToe.NEUTRAL_PLAYER
+
+    def get_board_size(self) -> Tuple[int, int]:
+        """
+        Gets the size of the board
+        :return: The width and height of the board
+        """
+        return self._width, self._height
+
+    def get_cell(self, move: Tuple[int, int]) -> chr:
+        """
+        Gets who is in the given cell
+        :param move: The 0-based coordinates of the cell
+        :return: The player in the cell, or TicTacToe.NEUTRAL_PLAYER if it's open
+        """
+
+        player = self._cells.get(move)
+        return TicTacToe.NEUTRAL_PLAYER if player is None else self._players[player]
+
+    def get_current_player(self) -> chr:
+        """
+        Gets the player whose move is being waited for
+        :return: The character that represents the player whose move is being waited for
+        """
+        return self._players[self._current_player]
+
+    def get_current_player_color(self) -> Color:
+        return self._player_colors[self._current_player]
+
+    def get_last_move(self) -> Optional[Tuple[int, int]]:
+        return self._last_move
+
+    def get_number_of_moves(self) -> int:
+        return len(self._cells)
+
+    def get_win_length(self) -> int:
+        return self._win_length
+
+    def get_winner(self) -> chr:
+        """
+        Gets the winner of the game, if there is one.
+        :return: The winner of the game, if there is one, otherwise TicTacToe.NEUTRAL_PLAYER
+        """
+        return self._winner
+
+    def get_win_edges(self) -> Tuple[Tuple[int, int], Tuple[int, int]]:
+        """
+        Gets the edges of the win, such as ((0, 0), (4, 4)) would represent five in a row from (0, 0) going down-right
+        """
+        return self._win_edges
+
+    def make_move(self, move: Tuple[int, int]) -> MoveError:
+        """
+        Makes the given move on the board
+        :param move: The 0-based coordinates where the move is trying to be made
+        :return: A MoveError that gives the status of the attempted move
+        """
+
+        # Make sure our move is going to be valid
+        if self.is_winner():
+            return MoveError.GAME_WON
+
+        elif move[0] >= self._width or move[0] < 0 or move[1] >= self._height or move[1] < 0:
+            return MoveError.OUT_OF_RANGE
+
+        elif move in self._cells:
+            return MoveError.TAKEN
+
+        # If we make it to here, then it is valid to make the move
+        move = (move[0], move[1])
+        self._cells[move] = self._current_player
+        self._last_move = move
+
+        self._check_for_winner()
+
+        # Only change who the player is if we didn't get a winner,
+        # otherwise the final board's color will be wrong
+        if not self.is_winner():
+            self._current_player = (self._current_player + 1) % len(self._players)
+
+        return MoveError.OKAY
+
+    def _check_for_winner(self) -> bool:
+        """
+        Checks the lines through the last move for k in a row. If one is found, self._winner will be set.
+        :return: True if there is a winner
+        """
+
+        x, y = self._last_move
+        player = self._current_player
+        cells = self._cells
+
+        for dx, dy in _DIRECTIONS:
+            # Walk away from the move both ways for as long as the cells are the player's,
+            # but never further than could still be part of the same k in a row
+            forward = 0
+            while (forward < self._win_length - 1 and
+                   cells.get((x + (forward + 1) * dx, y + (forward + 1) * dy)) == player):
+                forward = forward + 1
+
+            backward = 0
+            while (backward < self._win_length - 1 and
+                   cells.get((x - (backward + 1) * dx, y - (backward + 1) * dy)) == player):
+                backward = backward + 1
+
+            if forward + backward + 1 >= self._win_length:
+                self._winner = self._players[player]
+                self._win_edges = ((x - backward * dx, y - backward * dy), (x + forward * dx, y + forward * dy))
+                return True
+
+        return False
@@ -0,0 +1,71 @@
+__author__ = "David Antonucci"
+__version__ = "1.0.0"
+
+import threading
+import PyQt5.Qt as Qt
+from PyQt5.QtCore import QObject, QRunnable
+from tic_tac_toe import TicTacToe
+
+
+class MoveSearchSignals(QObject):
+    """
+    The signals of a MoveSearch. QRunnable isn't a QObject, so it can't have signals itself.
+    Because this object lives on the GUI thread, the signals are delivered there.
+    """
+
+    progress = Qt.pyqtSignal(object, int)  # The best (x, y) move so far, and how many positions or playouts
+    finished = Qt.pyqtSignal(object)  # The chosen (x, y) move, or None if the game was already over
+    cancelled = Qt.pyqtSignal()  # The search was cancelled, and has stopped
+
+
+class MoveSearch(QRunnable):
+    """
+    Runs a computer player's choose_move on a thread pool thread, so the GUI keeps running while it thinks.
+    The player must accept the should_stop and progress arguments of choose_move.
+    Exactly one of finished or cancelled is emitted, as the last thing run does. Whoever starts the search must keep a
+    reference to it until then, since Qt doesn't own it.
+    """
+
+    signals: MoveSearchSignals
+
+    def __init__(self, player, game: TicTacToe):
+        """
+        :param player: The computer player to ask for a move
+        :param game: The game to pick a move in. A copy is searched, so the game can change while the search runs.
+        """
+
+        super().__init__()
+
+        self.signals = MoveSearchSignals()
+
+        self._cancelled = threading.Event()
+        self._game = game.copy()
+        self._player = player
+
+        # Python owns this (the GUI holds it until it ends), so don't let Qt delete it too
+        self.setAutoDelete(False)
+
+    def cancel(self) -> None:
+        """
+        Stops the search as soon as it next checks, and makes sure it never reports a result
+        """
+        self._cancelled.set()
+
+    def get_player(self):
+        return self._player
+
+    def is_cancelled(self) -> bool:
+        return self._cancelled.is_set()
+
+    def run(self) -> None:
+        move = self._player.choose_move(self._game, should_stop=self._cancelled.is_set,
+                                        progress=self._report_progress)
+
+        if self._cancelled.is_set():
+            self.signals.cancelled.emit()
+        else:
+            self.signals.finished.emit(move)
+
+    def _report_progress(self, move, searched: int) -> None:
+        if not self._cancelled.is_set():
+            self.signals.progress.emit(move, searched)
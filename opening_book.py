@@ -0,0 +1,102 @@
+__author__ = "David Antonucci"
+__version__ = "1.0.0"
+
+import argparse
+import struct
+from record_file import SortedRecordFile
+from symmetry import canonicalize, get_inverse_symmetries, get_symmetries
+from tic_tac_toe import TicTacToe
+from typing import Dict, Optional, Tuple
+
+
+def _add_positions(game: TicTacToe, depth: int, player, book: Dict[int, int]) -> None:
+    """
+    Asks the player for a move in the game's position and every position reachable from it within the given depth.
+    Each group of symmetric positions is only searched once.
+    :param book: The canonical key of each position, mapped to its recommended move's canonical cell
+    """
+
+    if depth == 0 or game.is_winner() or game.is_board_full():
+        return
+
+    key, symmetry = canonicalize(game)
+    if key in book:
+        return
+
+    size = game.get_board_size()
+    x, y = player.choose_move(game)
+    book[key] = get_symmetries(size)[symmetry][(y * size) + x]
+
+    # A copy, since making and undoing the moves reorders the open cells
+    for move in tuple(game.legal_moves()):
+        game.make_move(move)
+        _add_positions(game, depth - 1, player, book)
+        game.undo_move()
+
+
+def build_opening_book(board_size: int, path: str, depth: int, player) -> int:
+    """
+    Searches every position in the first moves of a game, and writes the moves the player picks to a book file
+    :param board_size: The size of the board
+    :param path: Where to write the file
+    :param depth: How many moves into the game the book covers (1 is just the first move)
+    :param player: The player that picks the moves, which needs a choose_move(game) method
+    :return: How many positions were written (only one of each group of symmetric positions is stored)
+    """
+
+    book = {}
+    _add_positions(TicTacToe(board_size), depth, player, book)
+
+    return OpeningBook.write(path, board_size, {key: (cell,) for key, cell in book.items()}, depth)
+
+
+class OpeningBook(SortedRecordFile):
+    """
+    An opening book file, which isn't opened until the first lookup so it costs nothing to create.
+    It is memory-mapped, so lookups don't load or parse it.
+    """
+
+    _DESCRIPTION: str = "opening book"
+    _HEADER: struct.Struct = struct.Struct("<4sBBBxQ")  # magic, version, board size, depth, record count
+    _MAGIC: bytes = b"TTOB"
+    _VALUE: struct.Struct = struct.Struct("<H")  # The move's cell on the canonical board (u16 for boards over 16x16)
+    _VERSION: int = 2
+
+    def choose_move(self, game: TicTacToe) -> Optional[Tuple[int, int]]:
+        """
+        Looks up the recommended move for the player whose turn it is
+        :return: The 0-based (x, y) coordinates of the move, or None if the position isn't in the book
+        """
+
+        size = game.get_board_size()
+        if size != self.get_board_size() or game.is_winner():
+            return None
+
+        key, symmetry = canonicalize(game)
+        record = self._find(key)
+        if record is None:
+            return None
+
+        cell = get_inverse_symmetries(size)[symmetry][record[0]]
+        return cell % size, cell // size
+
+    def get_depth(self) -> int:
+        """
+        Gets how many moves into the game the book covers
+        """
+        self._load()
+        return self._header_fields[0]
+
+
+if __name__ == "__main__":
+    from minimax_player import MinimaxPlayer
+
+    parser = argparse.ArgumentParser(description="Builds an opening book by searching the first moves of a game")
+    parser.add_argument("size", type=int)
+    parser.add_argument("output")
+    parser.add_argument("--depth", type=int, default=2, help="How many moves into the game the book covers")
+    parser.add_argument("--time-limit", type=float, default=5.0, help="The seconds to search each position for")
+    args = parser.parse_args()
+
+    written = build_opening_book(args.size, args.output, args.depth, MinimaxPlayer(time_limit=args.time_limit))
+    print(f"Wrote {written} positions to {args.output}")
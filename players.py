@@ -0,0 +1,99 @@
+__author__ = "David Antonucci"
+__version__ = "1.0.0"
+
+import random
+from tic_tac_toe import TicTacToe
+from typing import List, Optional, Tuple
+
+
+class RandomPlayer:
+    """
+    A computer player that plays any open cell
+    """
+
+    _rng: random.Random
+
+    def __init__(self, seed: int=None):
+        self._rng = random.Random(seed)
+
+    def choose_move(self, game: TicTacToe) -> Optional[Tuple[int, int]]:
+        """
+        Picks a random open cell
+        :return: The 0-based (x, y) coordinates of the move, or None if the game is already over
+        """
+
+        return game.random_legal_move(self._rng)
+
+    def reseed(self, seed: int) -> None:
+        """
+        Restarts the player's random choices from the given seed
+        """
+        self._rng.seed(seed)
+
+
+class GreedyPlayer:
+    """
+    A computer player that wins if it can, blocks if it has to, and otherwise plays randomly
+    """
+
+    _rng: random.Random
+
+    def __init__(self, seed: int=None):
+        self._rng = random.Random(seed)
+
+    def choose_move(self, game: TicTacToe) -> Optional[Tuple[int, int]]:
+        """
+        Picks a winning move, then a blocking move, then a random open cell
+        :return: The 0-based (x, y) coordinates of the move, or None if the game is already over
+        """
+
+        if game.is_winner() or game.is_board_full():
+            return None
+
+        open_cells = game.legal_moves()
+        board = game.get_board()
+        size = game.get_board_size()
+        player = game.get_current_player()
+
+        blocking_move = None
+        for move in open_cells:
+            for owner in self._get_line_owners(board, size, move):
+                if owner == player:
+                    return move
+                elif owner != TicTacToe.NEUTRAL_PLAYER and blocking_move is None:
+                    blocking_move = move
+
+        if blocking_move is not None:
+            return blocking_move
+
+        return self._rng.choice(open_cells)
+
+    def reseed(self, seed: int) -> None:
+        """
+        Restarts the player's random choices from the given seed
+        """
+        self._rng.seed(seed)
+
+    @staticmethod
+    def _get_line_owners(board: Tuple[Tuple[chr]], size: int, move: Tuple[int, int]) -> List[chr]:
+        """
+        Gets who would complete each line through the given open cell by playing it
+        :return: For each line through the cell that has only one player in its other cells, that player
+        """
+
+        x, y = move
+        lines = [[board[y][col] for col in range(size) if col != x],
+                 [board[row][x] for row in range(size) if row != y]]
+
+        if x == y:
+            lines.append([board[i][i] for i in range(size) if i != x])
+
+        if x + y == size - 1:
+            lines.append([board[i][size - 1 - i] for i in range(size) if i != y])
+
+        owners = []
+        for line in lines:
+            if line and line[0] != TicTacToe.NEUTRAL_PLAYER and all(cell == line[0] for cell in line):
+                owners.append(line[0])
+
+        return owners
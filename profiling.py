@@ -0,0 +1,251 @@
+__author__ = "David Antonucci"
+__version__ = "1.0.0"
+
+import atexit
+import csv
+import functools
+import importlib
+import json
+import marshal
+import os
+import threading
+import time
+from typing import Callable, Dict, List, NamedTuple, Optional, Tuple
+
+# Set this to a file path to profile the whole run, and write the results there when the program exits.
+# The file's extension picks the format: .json, .csv, or anything else for a cProfile (pstats) dump.
+ENVIRONMENT_VARIABLE: str = "TTT_PROFILE"
+
+# The methods that get counted and timed, as (module, class, method). Subclasses that override one are timed too.
+# Only the ones whose module can be imported are used, so the Qt ones are skipped if PyQt5 isn't installed.
+TARGETS: Tuple[Tuple[str, str, str], ...] = (
+    ("tic_tac_toe", "TicTacToe", "make_move"),
+    ("tic_tac_toe", "TicTacToe", "_check_for_winner"),
+    ("tic_tac_toe", "TicTacToe", "_get_horizontal_winner"),
+    ("tic_tac_toe", "TicTacToe", "_get_vertical_winner"),
+    ("tic_tac_toe", "TicTacToe", "_get_diagonal_winner"),
+    ("tic_tac_toe", "TicTacToe", "print_board_to_console"),
+    ("bitboard_tic_tac_toe", "BitboardTicTacToe", "make_move"),
+    ("bitboard_tic_tac_toe", "BitboardTicTacToe", "_get_horizontal_winner"),
+    ("bitboard_tic_tac_toe", "BitboardTicTacToe", "_get_vertical_winner"),
+    ("bitboard_tic_tac_toe", "BitboardTicTacToe", "_get_diagonal_winner"),
+    ("console_helper", "ConsoleHelper", "get_background_code"),
+    ("console_helper", "ConsoleHelper", "get_foreground_code"),
+    ("console_helper", "ConsoleHelper", "set_print_background"),
+    ("console_helper", "ConsoleHelper", "set_print_foreground"),
+    ("console_helper", "ConsoleHelper", "reset_all_colors"),
+    ("console_helper", "ConsoleHelper", "revert_print_background"),
+    ("console_helper", "ConsoleHelper", "revert_print_foreground"),
+    ("game_board", "GameBoard", "paintEvent"),
+    ("qt_gui", "QtGui", "_cell_clicked"),
+)
+
+
+class CallStats(NamedTuple):
+    calls: int
+    total_seconds: float  # Including the time spent in other timed methods it called
+    own_seconds: float  # Not including the time spent in other timed methods it called
+
+    @property
+    def mean_seconds(self) -> float:
+        return self.total_seconds / self.calls if self.calls else 0.0
+
+
+class _Stats:
+    """
+    What has been recorded for one timed method
+    """
+
+    def __init__(self, name: str, function: Callable):
+        code = function.__code__
+
+        self.callers = {}  # The name of each timed method that called this one (None if none did) -> calls
+        self.calls = 0
+        self.code_key = (code.co_filename, code.co_firstlineno, name)  # How pstats identifies a function
+        self.name = name
+        self.own_seconds = 0.0
+        self.total_seconds = 0.0
+
+
+_lock = threading.Lock()
+_originals: List[Tuple[type, str, object]] = []  # What each patched method was, so it can be put back
+_stats: Dict[str, _Stats] = {}
+_thread_state = threading.local()  # Each thread's stack of [stats, seconds spent in timed calls it made]
+
+
+def _wrap(stats: _Stats, function: Callable) -> Callable:
+    """
+    Makes a version of the function that counts and times its calls
+    """
+
+    clock = time.perf_counter
+
+    @functools.wraps(function)
+    def timed(*args, **kwargs):
+        stack = getattr(_thread_state, "stack", None)
+        if stack is None:
+            stack = _thread_state.stack = []
+
+        frame = [stats, 0.0]
+        stack.append(frame)
+        start = clock()
+
+        try:
+            return function(*args, **kwargs)
+        finally:
+            elapsed = clock() - start
+            stack.pop()
+            caller = stack[-1] if stack else None
+
+            if caller is not None:
+                caller[1] += elapsed
+
+            with _lock:
+                stats.calls += 1
+                stats.total_seconds += elapsed
+                stats.own_seconds += elapsed - frame[1]
+
+                caller_name = None if caller is None else caller[0].name
+                stats.callers[caller_name] = stats.callers.get(caller_name, 0) + 1
+
+    return timed
+
+
+def enable() -> None:
+    """
+    Starts counting and timing the target methods, by replacing them with timed versions.
+    Nothing is changed until this is called, so there is no cost when profiling is off.
+    Qt handlers are connected when the window is built, so enable this before creating the QtGui.
+    """
+
+    if _originals:
+        return
+
+    for module_name, class_name, method_name in TARGETS:
+        try:
+            cls = getattr(importlib.import_module(module_name), class_name)
+        except ImportError:
+            continue
+
+        # Only replace methods the class defines itself; inherited ones are already timed on their own class
+        original = cls.__dict__.get(method_name)
+        if original is None:
+            continue
+
+        name = f"{class_name}.{method_name}"
+        is_static = isinstance(original, staticmethod)
+        function = original.__func__ if is_static else original
+
+        stats = _stats.get(name)
+        if stats is None:
+            stats = _stats[name] = _Stats(name, function)
+
+        timed = _wrap(stats, function)
+        setattr(cls, method_name, staticmethod(timed) if is_static else timed)
+        _originals.append((cls, method_name, original))
+
+
+def disable() -> None:
+    """
+    Puts the original methods back. What was recorded is kept until reset is called.
+    """
+
+    while _originals:
+        cls, method_name, original = _originals.pop()
+        setattr(cls, method_name, original)
+
+
+def is_enabled() -> bool:
+    return bool(_originals)
+
+
+def reset() -> None:
+    """
+    Forgets everything that has been recorded
+    """
+
+    with _lock:
+        for stats in _stats.values():
+            stats.callers.clear()
+            stats.calls = 0
+            stats.own_seconds = 0.0
+            stats.total_seconds = 0.0
+
+
+def get_stats() -> Dict[str, CallStats]:
+    """
+    Gets the calls and times of every timed method that has been called, by "Class.method"
+    """
+
+    with _lock:
+        return {name: CallStats(stats.calls, stats.total_seconds, stats.own_seconds)
+                for name, stats in sorted(_stats.items()) if stats.calls}
+
+
+def write_json(path: str) -> None:
+    with open(path, "w") as file:
+        json.dump({name: {"calls": stats.calls, "total_seconds": stats.total_seconds,
+                          "own_seconds": stats.own_seconds, "mean_seconds": stats.mean_seconds}
+                   for name, stats in get_stats().items()}, file, indent=2)
+
+
+def write_csv(path: str) -> None:
+    with open(path, "w", newline="") as file:
+        writer = csv.writer(file)
+        writer.writerow(("method", "calls", "total_seconds", "own_seconds", "mean_seconds"))
+        for name, stats in get_stats().items():
+            writer.writerow((name, stats.calls, stats.total_seconds, stats.own_seconds, stats.mean_seconds))
+
+
+def write_pstats(path: str) -> None:
+    """
+    Writes the results in the format cProfile's dump_stats uses, so they can be read with pstats or tools like snakeviz
+    """
+
+    with _lock:
+        timed = {name: stats for name, stats in _stats.items() if stats.calls}
+        dump = {}
+
+        for stats in timed.values():
+            # Callers are weighted by how often they made the call, since each call's own time isn't kept per caller
+            callers = {}
+            for caller_name, calls in stats.callers.items():
+                if caller_name is not None:
+                    share = calls / stats.calls
+                    callers[_stats[caller_name].code_key] = (calls, calls, stats.own_seconds * share,
+                                                            stats.total_seconds * share)
+
+            dump[stats.code_key] = (stats.calls, stats.calls, stats.own_seconds, stats.total_seconds, callers)
+
+    with open(path, "wb") as file:
+        marshal.dump(dump, file)
+
+
+def write_report(path: str) -> None:
+    """
+    Writes the results in the format that goes with the file's extension: .json, .csv, or a pstats dump otherwise
+    """
+
+    extension = os.path.splitext(path)[1].lower()
+
+    if extension == ".json":
+        write_json(path)
+    elif extension == ".csv":
+        write_csv(path)
+    else:
+        write_pstats(path)
+
+
+def enable_from_environment() -> Optional[str]:
+    """
+    Turns profiling on if the environment variable is set, and writes the results to its path when the program exits
+    :return: The path the results will be written to, or None if profiling is off
+    """
+
+    path = os.environ.get(ENVIRONMENT_VARIABLE)
+    if not path:
+        return None
+
+    enable()
+    atexit.register(write_report, path)
+    return path
@@ -3,23 +3,30 @@ __version__ = "1.0.0"
 
 import PyQt5.Qt as Qt
 from enums import Color, MoveError
-from game_cell import GameCell
-from PyQt5.QtGui import QColor, QIcon, QPaintEvent
+from game_board import GameBoard
+from mcts_player import MctsPlayer
+from minimax_player import MinimaxPlayer
+from move_search import MoveSearch
+from PyQt5.QtCore import QThreadPool
+from PyQt5.QtGui import QColor, QIcon
 from PyQt5.QtWidgets import *
 from tic_tac_toe import TicTacToe
-from typing import List, Tuple, Dict
+from typing import Optional, Set, Tuple, Dict
 
 
 class QtGui(QWidget):
-    _game_board_grid: QGridLayout
-    _board_cells: List[QLabel]
+    _computer_player: object
+    _computer_player_input: QCheckBox
+    _game_board: GameBoard
     _has_game_started: bool
     _board_size_input: QSpinBox
-    _first_cell: QLabel
+    _move_search: Optional[MoveSearch]
     _player_prompt: QLabel
+    _running_searches: Set[MoveSearch]
+
+    _COMPUTER_PLAYER: chr = 'O'
+    _COMPUTER_TIME_LIMIT: float = 2.0
 
-    _GAME_BOARD_SPACING: int = 5
-    _GAME_BOARD_CELL_SIZE: int = 75
     _COLOR_TABLE: Dict[Color, QColor] = {
         Color.BLACK: Qt.QColor(0, 0, 0),
         Color.WHITE: Qt.QColor(255, 255, 255),
@@ -33,137 +40,135 @@ class QtGui(QWidget):
         # noinspection PyArgumentList
         super().__init__()
 
-        self._board_cells = []  # The game cells (needed so we can delete or update them)
         self._board_size = board_size  # The size of the board (used for easily restarting the game)
         self._board_size_input = None  # The input that holds how big the board is supposed to be
-        self._first_cell = None  # The first cell in the grid (used for drawing things correctly)
+        self._computer_player_input = None  # The check box that says if the computer is playing
         self._game = TicTacToe(board_size)  # The game engine
-        self._game_board_grid = None  # The grid that holds the _board_cells (needed so new cells can be added)
+        self._computer_player = self._create_computer_player()  # Made once per game, and used for all its moves
+        self._game_board = None  # The widget that draws the board and reports which cell was clicked
+        self._move_search = None  # The computer's move search while it is thinking (so it can be cancelled)
         self._player_prompt = None  # The label that holds the prompt for whose turn it is, or who won
+        self._running_searches = set()  # Every search that hasn't ended yet, cancelled or not (so it isn't freed)
 
         self._has_game_started = False  # Indicates if the game has started (needed for a warning prompt)
 
         # Setup the UI
         self._initUI()
 
-    def paintEvent(self, event: QPaintEvent) -> None:
+    def _ask_yes_no(self, question: str, question_title: str) -> bool:
         """
-        Does custom line painting
-        :param event: The paint event information
+        Asks a yes or no question to the user
+        :param question: The question to ask the user
+        :param question_title: The title for the message box that is asking the question
+        :return: True if the Yes button is clicked
         """
 
-        # Get the coordinate of the top-left corner of the top-left cell
-        x = self._first_cell.pos().x()
-        y = self._first_cell.pos().y()
+        box = QMessageBox()
+        answer = box.question(self, question_title, question, QMessageBox.Yes | QMessageBox.No, QMessageBox.Yes)
+        return answer == QMessageBox.Yes
 
-        # Start the painter
-        qp = Qt.QPainter()
-        qp.begin(self)
+    def _cancel_computer_move(self) -> None:
+        """
+        Stops the computer thinking, if it is. Its move will never be played.
+        The search stays in self._running_searches until it has actually stopped.
+        """
 
-        # Setup the original horizontal and vertical line start points
-        horizontal_x_pos = x
-        horizontal_y_pos = y + self._GAME_BOARD_CELL_SIZE
-        vertical_x_pos = x + self._GAME_BOARD_CELL_SIZE
-        vertical_y_pos = y
+        if self._move_search is not None:
+            self._move_search.cancel()
+            self._move_search = None
 
-        # Setup some shorthands
-        board_size = self._board_size
-        long_size = (self._GAME_BOARD_SPACING * (board_size - 1)) + (self._GAME_BOARD_CELL_SIZE * board_size)
+    def _cell_clicked(self, cell_coordinates: Tuple[int, int]) -> None:
+        """
+        Fires when a game cell is clicked
+        :param cell_coordinates: The coordinates of the cell that was clicked
+        :return:
+        """
 
-        # Draw each horizontal and vertical line
-        for cross in range(board_size - 1):
-            qp.fillRect(horizontal_x_pos, horizontal_y_pos, long_size, self._GAME_BOARD_SPACING, Qt.QColor(0, 0, 0))
-            qp.fillRect(vertical_x_pos, vertical_y_pos, self._GAME_BOARD_SPACING, long_size, Qt.QColor(0, 0, 0))
+        # The player can't move for the computer
+        if self._is_computer_turn():
+            return
 
-            horizontal_y_pos = horizontal_y_pos + self._GAME_BOARD_CELL_SIZE + self._GAME_BOARD_SPACING
-            vertical_x_pos = vertical_x_pos + self._GAME_BOARD_CELL_SIZE + self._GAME_BOARD_SPACING
+        self._play_move(cell_coordinates)
 
-        # If we have a winner, then draw the line that crosses the n-in-a-row
-        if self._game.is_winner():
-            cell_size = self._GAME_BOARD_CELL_SIZE  # shorthand
-
-            (begin_x, begin_y), (end_x, end_y) = self._game.get_win_edges()
-
-            # Figure out where we're starting, and where we're ending.
-            # For the end coordinates, we need to add the final cell, if the direction we're going is not zero
-            # (otherwise we'd get an angled line)
-            x_start = x + (begin_x * (cell_size + self._GAME_BOARD_SPACING))
-            y_start = y + (begin_y * (cell_size + self._GAME_BOARD_SPACING))
-            x_end = x + (end_x * (cell_size + self._GAME_BOARD_SPACING)) + (cell_size if end_x > 0 else 0)
-            y_end = y + (end_y * (cell_size + self._GAME_BOARD_SPACING)) + (cell_size if end_y > 0 else 0)
-
-            # Shift half a cell for horizontal and vertical (so they're in the middle), and push all the way
-            # to the right if we have a win from the top right to the bottom left
-            if begin_x == end_x:  # Vertical win
-                x_start = x_end = x_start + (self._GAME_BOARD_CELL_SIZE / 2)
-            elif begin_y == end_y:  # Horizontal win
-                y_start = y_end = y_start + (self._GAME_BOARD_CELL_SIZE / 2)
-            elif begin_x == end_y:  # Top right to bottom left
-                x_start = x_start + cell_size
-
-            # Set the pen to be thick, and the color of the winner, then draw it
-            qp.setPen(Qt.QPen(self._COLOR_TABLE[self._game.get_current_player_color()], self._GAME_BOARD_SPACING))
-            qp.drawLine(x_start, y_start, x_end, y_end)
-
-        # Finalize the drawing
-        qp.end()
-
-    def _add_game_board_cells(self) -> None:
+    @Qt.pyqtSlot(name="computer player toggled")
+    def _computer_player_toggled(self) -> None:
         """
-        Adds the game cells to the GUI
+        The event handler for when the computer player check box is changed
         """
 
-        # We're using a giant font on this one
-        board_font = Qt.QFont("sans serif", 45)
-        self._first_cell = None
+        if self._is_computer_turn():
+            self._start_computer_move()
+        else:
+            self._cancel_computer_move()
+            self._update_player_prompt()
 
-        # Make sure we delete any old cells
-        for cell in self._board_cells:
-            cell.deleteLater()
+    def _computer_move_found(self, search: MoveSearch, move: Optional[Tuple[int, int]]) -> None:
+        """
+        Plays the computer's move once its search has finished
+        :param search: The search that found the move
+        :param move: The (x, y) move the computer chose
+        """
 
-        # And then remove what we'd stored previously
-        self._board_cells.clear()
+        self._computer_search_ended(search)
 
-        # Add all the cells, and set them up for the game play
-        for row_num in range(self._board_size):
-            for col_num in range(self._board_size):
-                cell = GameCell(TicTacToe.NEUTRAL_PLAYER)
-                cell.setFont(board_font)
-                cell.setAlignment(Qt.Qt.AlignCenter)
-                cell.setFixedHeight(self._GAME_BOARD_CELL_SIZE)
-                cell.setFixedWidth(self._GAME_BOARD_CELL_SIZE)
-                cell.set_mouse_press_event(self._cell_clicked, (row_num, col_num))
-                self._board_cells.append(cell)
+        # Ignore searches that were cancelled after they finished, but before this got to run
+        if search is not self._move_search:
+            return
 
-                # noinspection PyArgumentList
-                # +1 here because we have a spacer (see initUI())
-                self._game_board_grid.addWidget(cell, row_num, col_num + 1)
+        self._move_search = None
+        if move is None:
+            return
 
-                if self._first_cell is None:
-                    self._first_cell = cell
+        # The board uses (row, column), so reverse the coordinates
+        self._play_move((move[1], move[0]))
 
-    def _ask_yes_no(self, question: str, question_title: str) -> bool:
+    def _computer_move_progress(self, search: MoveSearch, move: Tuple[int, int], searched: int) -> None:
         """
-        Asks a yes or no question to the user
-        :param question: The question to ask the user
-        :param question_title: The title for the message box that is asking the question
-        :return: True if the Yes button is clicked
+        Shows what the computer is thinking of playing
         """
 
-        box = QMessageBox()
-        answer = box.question(self, question_title, question, QMessageBox.Yes | QMessageBox.No, QMessageBox.Yes)
-        return answer == QMessageBox.Yes
+        if search is self._move_search:
+            self._player_prompt.setText(f"Player {self._COMPUTER_PLAYER} is thinking... "
+                                        f"({move[0] + 1}, {move[1] + 1}) after {searched:,}")
 
-    def _cell_clicked(self, cell_coordinates: Tuple[int, int]) -> None:
+    def _computer_search_ended(self, search: MoveSearch) -> None:
         """
-        Fires when a game cell is clicked
-        :param cell_coordinates: The coordinates of the cell that was clicked
-        :return:
+        Forgets a search once its run has returned, and starts the computer thinking if it was waiting for it
+        :param search: The search that finished or was cancelled
         """
 
-        # Figure out who is playing, and their color
-        current_player = self._game.get_current_player()
-        color = self._COLOR_TABLE[self._game.get_current_player_color()]
+        self._running_searches.discard(search)
+
+        if self._move_search is None and self._is_computer_turn() and search.get_player() is self._computer_player:
+            self._start_computer_move()
+
+    def _create_computer_player(self):
+        """
+        Makes the computer player for the current game's board size
+        """
+
+        # A full search is fast enough on small boards, but bigger ones need a sampling search
+        if self._game.get_board_size() <= 4:
+            return MinimaxPlayer(time_limit=self._COMPUTER_TIME_LIMIT)
+
+        return MctsPlayer(time_limit=self._COMPUTER_TIME_LIMIT)
+
+    def _is_computer_turn(self) -> bool:
+        return (self._computer_player_input is not None and
+                self._computer_player_input.isChecked() and
+                not self._game.is_winner() and
+                not self._game.is_board_full() and
+                self._game.get_current_player() == self._COMPUTER_PLAYER)
+
+    def _play_move(self, cell_coordinates: Tuple[int, int]) -> None:
+        """
+        Makes a move for whoever's turn it is
+        :param cell_coordinates: The (row, column) of the cell to play
+        """
+
+        # Make sure the board knows what color the current player's mark is
+        self._game_board.set_player_color(self._game.get_current_player(),
+                                          self._COLOR_TABLE[self._game.get_current_player_color()])
 
         # We need to reverse the coordinates so they're in (x, y), not (y, x)
         reversed_coordinates = (cell_coordinates[1], cell_coordinates[0])
@@ -171,18 +176,16 @@ class QtGui(QWidget):
         # If the move is valid, then update everything accordingly
         if self._game.make_move(reversed_coordinates) == MoveError.OKAY:
             self._has_game_started = True
-            cell_index = (cell_coordinates[0] * self._game.get_board_size()) + cell_coordinates[1]
-            self._board_cells[cell_index].setText(current_player)
-            self._board_cells[cell_index].setStyleSheet(f"color: rgb({color.red()}, {color.green()}, {color.blue()})")
+            self._game_board.update_cell(cell_coordinates)
 
         # Update for what's going on next
         self._update_player_prompt()
 
-        # If we finished the game
-        if self._game.is_winner() or self._game.is_board_full():
-            # If the move got a winner, then force the entire thing to redraw so the win-line will be fully drawn
-            self.repaint()
+        if self._is_computer_turn():
+            self._start_computer_move()
 
+        # If we finished the game (the board's repaint, including the win line, happens while the question is up)
+        if self._game.is_winner() or self._game.is_board_full():
             # Ask if they user wants to play another game
             if self._ask_yes_no("Do you want to play another game?", "Play Again?"):
                 self._restart_game()
@@ -205,12 +208,11 @@ class QtGui(QWidget):
                 not self._ask_yes_no("This action will start a new game. Do you wish to proceed?", "Restart Game?")):
             return
 
-        # Save the size and restart the game
+        # Save the size and restart the game (which resizes the board, and stops the computer thinking)
         self._board_size = new_size
         self._restart_game()
 
-        # We need to update the cells and size, since things have changed
-        self._add_game_board_cells()
+        # We need to update the window size, since the board has changed size
         self.setFixedSize(self.sizeHint())
 
     # noinspection PyPep8Naming
@@ -265,39 +267,26 @@ class QtGui(QWidget):
         # noinspection PyArgumentList
         game_info_grid.addWidget(board_size_button, 0, 2)
 
+        # Whether the computer plays one side
+        self._computer_player_input = QCheckBox(f"Computer plays {self._COMPUTER_PLAYER}")
+        self._computer_player_input.setFont(font)
+        # noinspection PyUnresolvedReferences
+        self._computer_player_input.toggled.connect(self._computer_player_toggled)
+        # noinspection PyArgumentList
+        game_info_grid.addWidget(self._computer_player_input, 1, 0, 1, 3)
+
         # The prompt for the player so they can tell what's going on
         self._player_prompt = QLabel()
         self._player_prompt.setFont(Qt.QFont("sans serif", 14, 5))
         self._player_prompt.setContentsMargins(10, 10, 0, 10)
         self._update_player_prompt()
         # noinspection PyArgumentList
-        game_info_grid.addWidget(self._player_prompt, 1, 0, 1, 3)
+        game_info_grid.addWidget(self._player_prompt, 2, 0, 1, 3)
 
-        # Setup the game board
-        self._game_board_grid = QGridLayout()
-        self._game_board_grid.setSpacing(self._GAME_BOARD_SPACING)
-
-        # This section below fixes a visual bug when the grid is only 2x2. The bug is that the
-        # cells have extra spacing to spread out, which makes then not fit correctly within the
-        # lines that are drawn. So, here we are adding some empty widgets that are the preferred
-        # widgets to expand, when needed, therefore making there just be whitespace rather than
-        # there being the visual bug. They are set at columns 0 and 11, and have a row-span of
-        # two, since that is the only board size that has the issue.
-
-        # noinspection PyArgumentList
-        empty_left = QWidget()
-        # noinspection PyArgumentList
-        empty_right = QWidget()
-        empty_left.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Preferred)
-        empty_right.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Preferred)
-        # noinspection PyArgumentList
-        self._game_board_grid.addWidget(empty_left, 0, 0, 2, 1)
-        # noinspection PyArgumentList
-        self._game_board_grid.addWidget(empty_left, 0, 11, 2, 1)
-
-        self._add_game_board_cells()
-
-        main_layout.addLayout(self._game_board_grid)
+        # Setup the game board, centered in case the window is wider than it is
+        self._game_board = GameBoard(self._game)
+        self._game_board.cell_clicked.connect(self._cell_clicked)
+        main_layout.addWidget(self._game_board, 0, Qt.Qt.AlignHCenter)
 
         self.show()
         self.setFixedSize(self.size())
@@ -307,12 +296,38 @@ class QtGui(QWidget):
         Restarts the game, and all variables associated with it
         """
 
+        self._cancel_computer_move()
+
         self._game = TicTacToe(self._board_size)
+        self._computer_player = self._create_computer_player()
         self._has_game_started = False
         self._update_player_prompt()
+        self._game_board.set_game(self._game)
+
+        if self._is_computer_turn():
+            self._start_computer_move()
+
+    def _start_computer_move(self) -> None:
+        """
+        Starts the computer thinking about its move on a worker thread, so the GUI keeps responding
+        """
+
+        self._cancel_computer_move()
+        self._player_prompt.setText(f"Player {self._COMPUTER_PLAYER} is thinking...")
+
+        # The player can only search one position at a time, so if a cancelled search of this game is still
+        # stopping, _computer_search_ended starts the new one once it has
+        if any(search.get_player() is self._computer_player for search in self._running_searches):
+            return
+
+        search = MoveSearch(self._computer_player, self._game)
+        search.signals.progress.connect(lambda move, searched: self._computer_move_progress(search, move, searched))
+        search.signals.finished.connect(lambda move: self._computer_move_found(search, move))
+        search.signals.cancelled.connect(lambda: self._computer_search_ended(search))
+        self._move_search = search
+        self._running_searches.add(search)
 
-        for cell in self._board_cells:
-            cell.setText(TicTacToe.NEUTRAL_PLAYER)
+        QThreadPool.globalInstance().start(search)
 
     def _update_player_prompt(self) -> None:
         """
@@ -0,0 +1,160 @@
+__author__ = "David Antonucci"
+__version__ = "1.0.0"
+
+import bisect
+import mmap
+import struct
+from typing import BinaryIO, Dict, Optional, Tuple
+
+
+def get_key_size(board_size: int) -> int:
+    """
+    Gets how many bytes a position key takes up on a board of the given size
+    """
+    return ((2 * board_size ** 2) + 7) // 8
+
+
+class _RecordKeys:
+    """
+    Lets bisect search the keys of a memory-mapped file without reading them all in
+    """
+
+    def __init__(self, records: mmap.mmap, start: int, count: int, key_size: int, record_size: int):
+        self._count = count
+        self._key_size = key_size
+        self._record_size = record_size
+        self._records = records
+        self._start = start  # Where the first record is
+
+    def __getitem__(self, index: int) -> bytes:
+        start = self._start + (index * self._record_size)
+        return self._records[start:start + self._key_size]
+
+    def __len__(self) -> int:
+        return self._count
+
+
+class SortedRecordFile:
+    """
+    A file of fixed-size records sorted by position key, such as a tablebase or an opening book.
+    It isn't opened until it is first used, so it costs nothing to create, and it is memory-mapped, so lookups don't
+    load or parse it and every process that opens the same file shares one copy of it in memory.
+
+    File layout: a header, then one record per position. Each record is the key from symmetry.canonicalize
+    (big-endian, so comparing the bytes compares the keys), followed by the record's value.
+    Subclasses give the format with the class attributes.
+    """
+
+    _DESCRIPTION: str  # What the file is called in errors, such as "tablebase"
+    _HEADER: struct.Struct  # The magic, version, board size, any fields of the subclass's own, then the record count
+    _MAGIC: bytes
+    _VALUE: struct.Struct  # What follows the key in each record
+    _VERSION: int
+
+    _board_size: int
+    _file: Optional[BinaryIO]
+    _header_fields: Tuple
+    _keys: Optional[_RecordKeys]
+    _map: Optional[mmap.mmap]
+    _path: str
+
+    def __init__(self, path: str):
+
+        self._board_size = 0
+        self._file = None
+        self._header_fields = ()  # The subclass's own header fields
+        self._keys = None  # Set up the first time the file is used
+        self._map = None
+        self._path = path
+
+    def __getstate__(self) -> str:
+        # Worker processes open the file themselves instead of being sent its contents
+        return self._path
+
+    def __setstate__(self, path: str) -> None:
+        self.__init__(path)
+
+    def __len__(self) -> int:
+        return len(self._load())
+
+    @classmethod
+    def write(cls, path: str, board_size: int, records: Dict[int, Tuple], *header_fields) -> int:
+        """
+        Writes a file of this format
+        :param path: Where to write the file
+        :param board_size: The size of the board the keys are for
+        :param records: The key of each position, mapped to the fields of its value
+        :param header_fields: The subclass's own header fields
+        :return: How many records were written
+        """
+
+        key_size = get_key_size(board_size)
+        with open(path, "wb") as file:
+            file.write(cls._HEADER.pack(cls._MAGIC, cls._VERSION, board_size, *header_fields, len(records)))
+            for key in sorted(records):
+                file.write(key.to_bytes(key_size, "big"))
+                file.write(cls._VALUE.pack(*records[key]))
+
+        return len(records)
+
+    def close(self) -> None:
+        if self._keys is not None:
+            self._map.close()
+            self._file.close()
+            self._keys = None
+
+    def get_board_size(self) -> int:
+        self._load()
+        return self._board_size
+
+    def _find(self, key: int) -> Optional[Tuple]:
+        """
+        Looks up a position's record
+        :param key: The position's key, which must be for the file's board size
+        :return: The fields of the record's value, or None if the position isn't in the file
+        """
+
+        keys = self._load()
+        key_bytes = key.to_bytes(keys._key_size, "big")
+
+        index = bisect.bisect_left(keys, key_bytes)
+        if index == len(keys) or keys[index] != key_bytes:
+            return None
+
+        return self._VALUE.unpack_from(self._map, self._HEADER.size + (index * keys._record_size) + keys._key_size)
+
+    def _load(self) -> _RecordKeys:
+        """
+        Opens the file, if it hasn't been already
+        :raises ValueError: If the file isn't a valid file of this format
+        """
+
+        if self._keys is not None:
+            return self._keys
+
+        file = open(self._path, "rb")
+        if len(file.read(self._HEADER.size)) < self._HEADER.size:
+            file.close()
+            raise ValueError(f"{self._path} is too small to be a valid {self._DESCRIPTION}")
+
+        records = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, board_size, *header_fields, count = self._HEADER.unpack_from(records)
+        key_size = get_key_size(board_size)
+        record_size = key_size + self._VALUE.size
+
+        if magic != self._MAGIC or version != self._VERSION:
+            records.close()
+            file.close()
+            raise ValueError(f"{self._path} is not a version {self._VERSION} {self._DESCRIPTION}")
+
+        if len(records) != self._HEADER.size + (count * record_size):
+            records.close()
+            file.close()
+            raise ValueError(f"{self._path} is truncated or has extra data")
+
+        self._board_size = board_size
+        self._file = file
+        self._header_fields = tuple(header_fields)
+        self._map = records
+        self._keys = _RecordKeys(records, self._HEADER.size, count, key_size, record_size)
+        return self._keys
@@ -0,0 +1,195 @@
+__author__ = "David Antonucci"
+__version__ = "1.0.0"
+
+from functools import lru_cache
+from tic_tac_toe import TicTacToe
+from typing import NamedTuple, Tuple
+
+# Each symmetry's byte tables are indexed by which byte of the bitboard is being moved, then by the byte's value
+ByteTables = Tuple[Tuple[int, ...], ...]
+
+
+class CanonicalPosition(NamedTuple):
+    key: int  # (first player's cells << board size ** 2) | second player's cells, after the symmetry is applied
+    symmetry: int  # The index (into get_symmetries) of the symmetry that turns the position into its canonical form
+
+
+@lru_cache(maxsize=None)
+def get_symmetries(board_size: int) -> Tuple[Tuple[int, ...], ...]:
+    """
+    Gets the 8 rotations and reflections of the board as cell permutations, where cell (x, y) is (y * board_size) + x
+    :param board_size: The size of the board
+    :return: For each symmetry, the cell each cell is moved to. The first one is the identity.
+    """
+
+    last = board_size - 1
+    transforms = (
+        lambda x, y: (x, y),
+        lambda x, y: (last - y, x),
+        lambda x, y: (last - x, last - y),
+        lambda x, y: (y, last - x),
+        lambda x, y: (last - x, y),
+        lambda x, y: (x, last - y),
+        lambda x, y: (y, x),
+        lambda x, y: (last - y, last - x),
+    )
+
+    symmetries = []
+    for transform in transforms:
+        permutation = []
+        for cell in range(board_size ** 2):
+            new_x, new_y = transform(cell % board_size, cell // board_size)
+            permutation.append((new_y * board_size) + new_x)
+        symmetries.append(tuple(permutation))
+
+    return tuple(symmetries)
+
+
+@lru_cache(maxsize=None)
+def get_inverse_symmetries(board_size: int) -> Tuple[Tuple[int, ...], ...]:
+    """
+    Gets the permutations that undo each of the ones from get_symmetries
+    :param board_size: The size of the board
+    """
+
+    inverses = []
+    for permutation in get_symmetries(board_size):
+        inverse = [0] * len(permutation)
+        for cell, moved_to in enumerate(permutation):
+            inverse[moved_to] = cell
+        inverses.append(tuple(inverse))
+
+    return tuple(inverses)
+
+
+def _build_byte_tables(permutation: Tuple[int, ...]) -> ByteTables:
+    """
+    Builds the tables that move a bitboard's cells a byte at a time to where the permutation says they go
+    """
+
+    tables = []
+    for first_cell in range(0, len(permutation), 8):
+        table = [0] * 256
+
+        # Each value is a smaller value (without its lowest bit) plus where that bit goes
+        for value in range(1, 256):
+            low_bit = value & -value
+            cell = first_cell + low_bit.bit_length() - 1
+            table[value] = table[value ^ low_bit] | (1 << permutation[cell] if cell < len(permutation) else 0)
+
+        tables.append(tuple(table))
+
+    return tuple(tables)
+
+
+@lru_cache(maxsize=None)
+def _get_key_byte_tables(board_size: int) -> Tuple[ByteTables, ...]:
+    """
+    Gets lookup tables that apply each symmetry to a whole key (both players' cells) a byte at a time, instead of a
+    bit at a time. Entry [symmetry][byte][value] holds where the cells of that byte go, for every value it can have.
+    """
+
+    cell_count = board_size ** 2
+    return tuple(_build_byte_tables(permutation + tuple(cell + cell_count for cell in permutation))
+                 for permutation in get_symmetries(board_size))
+
+
+def canonicalize_bitboards(first: int, second: int, board_size: int) -> CanonicalPosition:
+    """
+    Finds the canonical form of a position, which is the smallest key among all its symmetries
+    :param first: The cells of the first player in the key (usually the player to move)
+    :param second: The cells of the other player
+    :param board_size: The size of the board
+    :return: The key of the canonical position, which is (first << board_size ** 2) | second after the symmetry is
+             applied, and the index of the symmetry that produces it
+    """
+
+    key = (first << (board_size ** 2)) | second
+    best_key = key  # The identity
+    best_symmetry = 0
+
+    # Each symmetry's tables move the key a byte at a time (inlined, since this runs for every position searched)
+    for index, tables in enumerate(_get_key_byte_tables(board_size)[1:], 1):
+        permuted = 0
+        bits = key
+        for table in tables:
+            permuted |= table[bits & 0xFF]
+            bits >>= 8
+
+        if permuted < best_key:
+            best_key = permuted
+            best_symmetry = index
+
+    return CanonicalPosition(best_key, best_symmetry)
+
+
+def get_player_bitboards(game: TicTacToe) -> Tuple[int, int]:
+    """
+    Gets the cells held by each player (X, then O) as bitboards, where cell (x, y) is bit (y * board size) + x
+    """
+
+    if hasattr(game, "get_bitboards"):
+        return game.get_bitboards()
+
+    first = second = 0
+    for cell, value in enumerate(value for row in game.get_board() for value in row):
+        if value == 'X':
+            first |= 1 << cell
+        elif value != TicTacToe.NEUTRAL_PLAYER:
+            second |= 1 << cell
+
+    return first, second
+
+
+def canonicalize(game: TicTacToe) -> CanonicalPosition:
+    """
+    Finds the canonical form of a game's position, with X's cells first in the key.
+    Anything found on the canonical position can be mapped back to the game with restore_move and restore_win_edges.
+    """
+    return canonicalize_bitboards(*get_player_bitboards(game), game.get_board_size())
+
+
+def transform_move(move: Tuple[int, int], symmetry: int, board_size: int) -> Tuple[int, int]:
+    """
+    Moves an (x, y) cell of the real board to where it is on the board the symmetry makes
+    """
+
+    cell = get_symmetries(board_size)[symmetry][(move[1] * board_size) + move[0]]
+    return cell % board_size, cell // board_size
+
+
+def restore_move(move: Tuple[int, int], symmetry: int, board_size: int) -> Tuple[int, int]:
+    """
+    Moves an (x, y) cell of the board the symmetry makes back to where it is on the real board
+    """
+
+    cell = get_inverse_symmetries(board_size)[symmetry][(move[1] * board_size) + move[0]]
+    return cell % board_size, cell // board_size
+
+
+def _order_win_edges(begin: Tuple[int, int], end: Tuple[int, int]) -> Tuple[Tuple[int, int], Tuple[int, int]]:
+    """
+    Puts the edges of a win in the order TicTacToe.get_win_edges uses: rows left to right, and columns and
+    diagonals from the top row down
+    """
+    return (begin, end) if (begin[1], begin[0]) <= (end[1], end[0]) else (end, begin)
+
+
+def transform_win_edges(win_edges: Tuple[Tuple[int, int], Tuple[int, int]], symmetry: int,
+                        board_size: int) -> Tuple[Tuple[int, int], Tuple[int, int]]:
+    """
+    Moves the edges of a win on the real board to where they are on the board the symmetry makes
+    """
+
+    begin, end = win_edges
+    return _order_win_edges(transform_move(begin, symmetry, board_size), transform_move(end, symmetry, board_size))
+
+
+def restore_win_edges(win_edges: Tuple[Tuple[int, int], Tuple[int, int]], symmetry: int,
+                      board_size: int) -> Tuple[Tuple[int, int], Tuple[int, int]]:
+    """
+    Moves the edges of a win on the board the symmetry makes back to where they are on the real board
+    """
+
+    begin, end = win_edges
+    return _order_win_edges(restore_move(begin, symmetry, board_size), restore_move(end, symmetry, board_size))
@@ -0,0 +1,140 @@
+__author__ = "David Antonucci"
+__version__ = "1.0.0"
+
+import re
+import struct
+import sys
+from bitboard_tic_tac_toe import get_cell_win_masks
+from record_file import SortedRecordFile, get_key_size
+from symmetry import canonicalize_bitboards, get_inverse_symmetries, get_player_bitboards, get_symmetries
+from tic_tac_toe import TicTacToe
+from typing import Dict, NamedTuple, Optional, Tuple
+
+# Values are from the point of view of the player to move: _WIN_VALUE minus how many plies the
+# game lasts for a win, the negative of that for a loss, and zero for a draw
+_WIN_VALUE: int = 127
+NO_MOVE: int = 255
+
+
+class TablebaseEntry(NamedTuple):
+    value: int
+    move: Optional[Tuple[int, int]]
+
+
+def _solve(mine: int, theirs: int, last_cell: int, board_size: int, solved: Dict[int, Tuple[int, int]]) -> int:
+    """
+    Finds the exact value of a position and every position reachable from it, storing them under their canonical keys
+    :param mine: The cells of the player to move
+    :param theirs: The cells of the player who just moved
+    :param last_cell: The cell the opponent just played, or -1 at the start of the game
+    :param solved: The canonical key of each solved position, mapped to its value and canonical best move
+    :return: The value of the position
+    """
+
+    key, symmetry = canonicalize_bitboards(mine, theirs, board_size)
+    if key in solved:
+        return solved[key][0]
+
+    cell_lines = get_cell_win_masks(board_size)
+    taken = mine | theirs
+    best_value = None
+    best_cell = NO_MOVE
+
+    if last_cell >= 0 and any(theirs & mask == mask for mask in cell_lines[last_cell]):
+        best_value = -_WIN_VALUE
+    elif taken == (1 << board_size ** 2) - 1:
+        best_value = 0
+    else:
+        for cell in range(board_size ** 2):
+            if taken & (1 << cell):
+                continue
+
+            # Move a win or loss one ply further away, so quicker wins are worth more
+            value = -_solve(theirs, mine | (1 << cell), cell, board_size, solved)
+            value = value - 1 if value > 0 else value + 1 if value < 0 else 0
+
+            if best_value is None or value > best_value:
+                best_value = value
+                best_cell = get_symmetries(board_size)[symmetry][cell]
+
+    solved[key] = (best_value, best_cell)
+    return best_value
+
+
+def build_tablebase(board_size: int, path: str) -> int:
+    """
+    Solves every reachable position of the given board size, and writes them to a tablebase file
+    :param board_size: The size of the board
+    :param path: Where to write the file
+    :return: How many positions were written (only one of each group of symmetric positions is stored)
+    """
+
+    solved = {}
+    _solve(0, 0, -1, board_size, solved)
+
+    return Tablebase.write(path, board_size, solved)
+
+
+class Tablebase(SortedRecordFile):
+    """
+    A solved tablebase file, memory-mapped so that lookups don't load or parse it, and so that every
+    process that opens the same file shares one copy of it in memory
+    """
+
+    _DESCRIPTION: str = "tablebase"
+    _HEADER: struct.Struct = struct.Struct("<4sBBxxQ")  # magic, version, board size, record count
+    _MAGIC: bytes = b"TTTB"
+    _VALUE: struct.Struct = struct.Struct("<bB")  # The value, and the best move's cell on the canonical board
+    _VERSION: int = 1
+
+    def __init__(self, path: str):
+        super().__init__(path)
+
+        # Open the file straight away, so a bad file is reported when the tablebase is made
+        self._load()
+
+    def choose_move(self, game: TicTacToe) -> Optional[Tuple[int, int]]:
+        """
+        Picks the best move for the player whose turn it is, so the tablebase can be used as a player
+        :return: The 0-based (x, y) coordinates of the move, or None if the game is over or not in the tablebase
+        """
+
+        entry = self.lookup(game)
+        return None if entry is None else entry.move
+
+    def lookup(self, game: TicTacToe) -> Optional[TablebaseEntry]:
+        """
+        Looks up the value and best move of the game's current position
+        :param game: The game to look up. It must be the tablebase's board size.
+        :return: The entry for the position, or None if the position isn't in the tablebase
+        """
+
+        if game.get_board_size() != self.get_board_size():
+            return None
+
+        first, second = get_player_bitboards(game)
+        mine, theirs = (first, second) if game.get_current_player() == 'X' else (second, first)
+
+        # A won game's current player is the winner, so the position is stored for the other player
+        if game.is_winner():
+            mine, theirs = theirs, mine
+
+        key, symmetry = canonicalize_bitboards(mine, theirs, self._board_size)
+        record = self._find(key)
+        if record is None:
+            return None
+
+        value, cell = record
+        if cell == NO_MOVE:
+            return TablebaseEntry(value, None)
+
+        cell = get_inverse_symmetries(self._board_size)[symmetry][cell]
+        return TablebaseEntry(value, (cell % self._board_size, cell // self._board_size))
+
+
+if __name__ == "__main__":
+    if len(sys.argv) < 3 or re.match("^\d+$", sys.argv[1]) is None:
+        print(f"Usage: {sys.argv[0]} <board size> <output file>")
+        sys.exit(1)
+
+    print(f"Wrote {build_tablebase(int(sys.argv[1]), sys.argv[2])} positions to {sys.argv[2]}")
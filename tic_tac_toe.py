@@ -1,41 +1,243 @@
 __author__ = "David Antonucci"
 __version__ = "1.0.0"
 
-import os
+import copy
+import random
+import struct
+import sys
+from collections.abc import Sequence
 from console_helper import ConsoleHelper
-from typing import List, Tuple, Dict
+from functools import lru_cache
+from typing import Iterator, List, Optional, Tuple, Dict
 from enums import Color, MoveError
 
+# The layout of to_bytes: version, board size, flags, number of moves, and the last move's x and y (0xFF if none),
+# followed by 2 bits per cell (0 for open, otherwise 1 + the player), packed four cells to a byte
+_SNAPSHOT_VERSION: int = 1
+_SNAPSHOT_HEADER: struct.Struct = struct.Struct("<BBBHBB")
+_SNAPSHOT_NO_MOVE: int = 0xFF
+
+# The flags hold the current player in bit 0, and 1 + the winner (or 0 for no winner) in bits 1 and 2
+_SNAPSHOT_WINNER_SHIFT: int = 1
+
+# The Zobrist keys are drawn from a fixed seed, so a position hashes the same in every game and every process
+_ZOBRIST_SEED: int = 0x5A0B715
+
+
+@lru_cache(maxsize=None)
+def _get_cells(board_size: int) -> Tuple[Tuple[int, int], ...]:
+    """
+    Gets the (x, y) coordinates of every cell, in order of cell number ((y * board size) + x)
+    """
+    return tuple((col, row) for row in range(board_size) for col in range(board_size))
+
+
+@lru_cache(maxsize=None)
+def _get_zobrist_keys(board_size: int) -> Tuple[Tuple[int, ...], ...]:
+    """
+    Gets a random 64-bit key for each player in each cell, indexed by the player and then the cell number.
+    A position's hash is the XOR of the keys of its played cells.
+    """
+
+    rng = random.Random(_ZOBRIST_SEED ^ board_size)
+    return tuple(tuple(rng.getrandbits(64) for _ in range(board_size ** 2)) for _ in TicTacToe._players)
+
+
+class LegalMoves(Sequence):
+    """
+    A read-only view of a game's open cells, as returned by TicTacToe.legal_moves. Nothing is copied to make it, so it
+    changes as moves are made and undone; copy it (with list or tuple) to make moves while looping over it.
+    """
+
+    __slots__ = ("_cells",)
+
+    def __init__(self, cells: List[Tuple[int, int]]):
+        self._cells = cells  # The game's own list of open cells
+
+    def __contains__(self, move) -> bool:
+        return move in self._cells
+
+    def __getitem__(self, index):
+        return self._cells[index]
+
+    def __iter__(self) -> Iterator[Tuple[int, int]]:
+        return iter(self._cells)
+
+    def __len__(self) -> int:
+        return len(self._cells)
+
+    def __repr__(self) -> str:
+        return f"LegalMoves({self._cells!r})"
+
 
 class TicTacToe:
     NEUTRAL_PLAYER: chr = ' '
 
     _board_size: int
     _board: List[List[chr]]
+    _column_counts: List[List[int]]
     _current_player: int
+    _diagonal_counts: List[List[int]]
+    _hash: int
     _last_move: Tuple[int, int]
+    _moves: List[Tuple[int, int]]
     _number_of_moves: int
-    _players: List[chr]
-    _player_colors: Dict[int, Color]
+    _open_cells: List[Tuple[int, int]]
+    _open_cell_positions: List[int]
+    _players: Tuple[chr, ...] = ('X', 'O')  # These never change, so every game shares them
+    _player_colors: Dict[int, Color] = {0: Color.GREEN, 1: Color.YELLOW}
+    _redo_moves: List[Tuple[int, int]]
+    _row_counts: List[List[int]]
     _winner: chr
     _win_edges: Tuple[Tuple[int, int], Tuple[int, int]]
+    _zobrist_keys: Tuple[Tuple[int, ...], ...]
 
     def __init__(self, board_size: int):
 
-        self._board = []
         self._board_size = board_size
         self._current_player = 0
+        self._hash = 0  # The Zobrist hash of the played cells (an empty board is 0)
         self._last_move = None
+        self._moves = []  # Every move made, in order (needed so games can be recorded)
         self._number_of_moves = 0
-        self._players = ['X', 'O']
-        self._player_colors = {0: Color.GREEN, 1: Color.YELLOW}
+        self._redo_moves = []  # The moves that were undone, the most recent last
         self._winner = self.NEUTRAL_PLAYER
         self._win_edges = ((0, 0), (0, 0))
+        self._zobrist_keys = _get_zobrist_keys(board_size)  # Shared by every game of this size
 
-        for row in range(self._board_size):
-            self._board.append([])
-            for col in range(self._board_size):
-                self._board[row].append(self.NEUTRAL_PLAYER)
+        self._create_board()
+
+        # Every cell starts open, with each one's position in the open cells being its cell number
+        self._open_cells = list(_get_cells(board_size))
+        self._open_cell_positions = list(range(board_size ** 2))
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "TicTacToe":
+        """
+        Restores a game saved by to_bytes, without replaying its moves
+        :param data: The saved game
+        :return: The restored game (of the class this is called on, so the engine can be picked)
+        :raises ValueError: If the data is not a valid saved game
+        """
+
+        if len(data) < _SNAPSHOT_HEADER.size:
+            raise ValueError("The saved game is too short")
+
+        version, board_size, flags, number_of_moves, last_x, last_y = _SNAPSHOT_HEADER.unpack_from(data)
+
+        if version != _SNAPSHOT_VERSION:
+            raise ValueError(f"Saved games of version {version} are not supported")
+
+        cell_count = board_size ** 2
+        if board_size < 1 or len(data) != _SNAPSHOT_HEADER.size + ((cell_count + 3) // 4):
+            raise ValueError("The saved game's length doesn't match its board size")
+
+        current_player = flags & 1
+        winner = (flags >> _SNAPSHOT_WINNER_SHIFT) - 1
+        if flags >> (_SNAPSHOT_WINNER_SHIFT + 2) or winner >= len(cls._players):
+            raise ValueError("The saved game has invalid flags")
+
+        # Put every player's cells back on the board
+        game = cls(board_size)
+        counts = [0 for _ in cls._players]
+        cells = data[_SNAPSHOT_HEADER.size:]
+
+        # The bits after the last cell are padding, and must be left empty
+        if cell_count & 3 and cells[-1] >> ((cell_count & 3) * 2):
+            raise ValueError("The saved game has data after its last cell")
+
+        for cell in range(cell_count):
+            value = (cells[cell >> 2] >> ((cell & 3) * 2)) & 3
+            if value == 0:
+                continue
+            elif value > len(cls._players):
+                raise ValueError("The saved game has an invalid cell")
+
+            game._current_player = value - 1
+            game._set_cell((cell % board_size, cell // board_size))
+            game._hash ^= game._zobrist_keys[value - 1][cell]
+            counts[value - 1] = counts[value - 1] + 1
+
+        if sum(counts) != number_of_moves or counts[0] - counts[1] not in (0, 1):
+            raise ValueError("The saved game's cells don't match its number of moves")
+
+        # Check the last move was made by the player who moved last, and see if it won
+        last_player = (number_of_moves - 1) % len(cls._players)
+        if number_of_moves == 0:
+            if (last_x, last_y) != (_SNAPSHOT_NO_MOVE, _SNAPSHOT_NO_MOVE):
+                raise ValueError("The saved game has a last move, but no moves")
+        else:
+            last_move = (last_x, last_y)
+            if (last_x >= board_size or last_y >= board_size or
+                    game._get_cell(last_move) != cls._players[last_player]):
+                raise ValueError("The saved game's last move isn't one of the last player's cells")
+
+            # The game would have ended sooner if there were a full line that the last move isn't on
+            for cell in range(cell_count):
+                move = (cell % board_size, cell // board_size)
+                owner = game._get_cell(move)
+                if owner == cls.NEUTRAL_PLAYER:
+                    continue
+
+                game._last_move = move
+                game._current_player = cls._players.index(owner)
+                if game._check_for_winner() and not game._is_on_win_line(last_move):
+                    raise ValueError("The saved game has a win that isn't on its last move")
+
+                game._winner = cls.NEUTRAL_PLAYER
+                game._win_edges = ((0, 0), (0, 0))
+
+            game._last_move = last_move
+            game._current_player = last_player
+            game._check_for_winner()
+
+        game._number_of_moves = number_of_moves
+        game._find_open_cells()
+
+        if game._winner != (cls.NEUTRAL_PLAYER if winner < 0 else cls._players[winner]):
+            raise ValueError("The saved game's winner doesn't match its board")
+
+        # The turn only passes if the last move didn't win
+        expected_player = last_player if game.is_winner() else number_of_moves % len(cls._players)
+        if current_player != expected_player:
+            raise ValueError("The saved game's current player is out of turn")
+
+        game._current_player = current_player
+        return game
+
+    def to_bytes(self) -> bytes:
+        """
+        Saves the game in a small, fixed layout (a few dozen bytes even for a 10x10 board), which can be restored with
+        from_bytes. Only the board and the last move are saved, not the history of moves.
+        """
+
+        cells = bytearray((self._board_size ** 2 + 3) // 4)
+        players = {player: number + 1 for number, player in enumerate(self._players)}
+
+        for cell, value in enumerate(value for row in self.get_board() for value in row):
+            if value != self.NEUTRAL_PLAYER:
+                cells[cell >> 2] |= players[value] << ((cell & 3) * 2)
+
+        winner = players[self._winner] if self.is_winner() else 0
+        last_x, last_y = self._last_move if self._last_move is not None else (_SNAPSHOT_NO_MOVE, _SNAPSHOT_NO_MOVE)
+
+        header = _SNAPSHOT_HEADER.pack(_SNAPSHOT_VERSION, self._board_size,
+                                       self._current_player | (winner << _SNAPSHOT_WINNER_SHIFT),
+                                       self._number_of_moves, last_x, last_y)
+        return header + bytes(cells)
+
+    def copy(self) -> "TicTacToe":
+        """
+        Makes an independent copy of the game, so moves can be tried on it without changing this one
+        """
+
+        game = copy.copy(self)
+        game._copy_board_from(self)
+        game._moves = self._moves[:]
+        game._redo_moves = self._redo_moves[:]
+        game._open_cells = self._open_cells[:]
+        game._open_cell_positions = self._open_cell_positions[:]
+        return game
 
     def is_board_full(self):
         return self._number_of_moves == self._board_size ** 2
@@ -68,6 +270,18 @@ class TicTacToe:
     def get_current_player_color(self) -> Color:
         return self._player_colors[self._current_player]
 
+    def get_moves(self) -> Tuple[Tuple[int, int], ...]:
+        """
+        Gets every move made in this game, in order. A game restored by from_bytes only has the moves made since.
+        """
+        return tuple(self._moves)
+
+    def get_last_move(self) -> Tuple[int, int]:
+        """
+        Gets the last move that was made, or None if no moves have been made
+        """
+        return self._last_move
+
     def get_winner(self) -> chr:
         """
         Gets the winner of the game, if there is one.
@@ -81,6 +295,39 @@ class TicTacToe:
         """
         return self._win_edges
 
+    def position_hash(self) -> int:
+        """
+        Gets a 64-bit Zobrist hash of the board, which is kept up to date as moves are made and undone.
+        Games of the same size with the same cells played hash the same, whatever order the moves were made in,
+        and in every process.
+        """
+        return self._hash
+
+    def legal_moves(self) -> LegalMoves:
+        """
+        Gets every move that can be made, in no particular order. The open cells are kept up to date as moves are
+        made and undone, so this doesn't scan the board or copy anything.
+        :return: A read-only view of the 0-based (x, y) coordinates of the open cells, which is empty if the game has
+                 been won. It follows the game as moves are made, so copy it to make moves while looping over it.
+        """
+
+        if self.is_winner():
+            return LegalMoves([])
+
+        return LegalMoves(self._open_cells)
+
+    def random_legal_move(self, rng: random.Random=None) -> Optional[Tuple[int, int]]:
+        """
+        Picks a random open cell, without scanning the board
+        :param rng: The random generator to pick with, or None to use the random module's
+        :return: The 0-based (x, y) coordinates of the move, or None if no move can be made
+        """
+
+        if self.is_winner() or not self._open_cells:
+            return None
+
+        return (rng or random).choice(self._open_cells)
+
     def make_move(self, move: Tuple[int, int]) -> MoveError:
         """
         Makes the given move on the board
@@ -95,110 +342,209 @@ class TicTacToe:
         elif move[0] >= self._board_size or move[0] < 0 or move[1] >= self._board_size or move[1] < 0:
             return MoveError.OUT_OF_RANGE
 
-        elif self._board[move[1]][move[0]] != self.NEUTRAL_PLAYER:
+        elif self._get_cell(move) != self.NEUTRAL_PLAYER:
             return MoveError.TAKEN
 
-        # If we make it to here, then it is valid to make the move
-        self._board[move[1]][move[0]] = self._players[self._current_player]
-        self._number_of_moves = self._number_of_moves + 1
-        self._last_move = move
+        # If we make it to here, then it is valid to make the move (and a new move replaces anything undone)
+        self._redo_moves.clear()
+        self._play_move(move)
 
-        self._check_for_winner()
+        return MoveError.OKAY
 
-        # Only change who the player is if we didn't get a winner,
-        # otherwise the final board's color will be wrong
-        if not self.is_winner():
-            self._current_player = (self._current_player + 1) % len(self._players)
+    def redo_move(self) -> Optional[Tuple[int, int]]:
+        """
+        Makes the most recently undone move again
+        :return: The move that was made, or None if there's nothing to redo
+        """
 
-        return MoveError.OKAY
+        if not self._redo_moves:
+            return None
+
+        move = self._redo_moves.pop()
+        self._play_move(move)
+        return move
+
+    def undo_move(self) -> Optional[Tuple[int, int]]:
+        """
+        Takes back the last move, without copying anything. The move can be made again with redo_move.
+        A game restored by from_bytes can only undo the moves made since it was restored.
+        :return: The move that was taken back, or None if there's nothing to undo
+        """
+
+        if not self._moves:
+            return None
+
+        move = self._moves.pop()
+
+        # Whoever is in the cell made the move, and it's their turn again. A game can only be won by its
+        # last move, so taking it back always leaves the game without a winner.
+        self._current_player = self._players.index(self._get_cell(move))
+        self._clear_cell(move)
+        self._add_open_cell(move)
+        self._hash ^= self._zobrist_keys[self._current_player][(move[1] * self._board_size) + move[0]]
+        self._number_of_moves = self._number_of_moves - 1
+        self._last_move = self._moves[-1] if self._moves else None
+        self._winner = self.NEUTRAL_PLAYER
+        self._win_edges = ((0, 0), (0, 0))
+
+        self._redo_moves.append(move)
+        return move
 
     def print_board_to_console(self, enable_colorization: bool=True, clear_screen: bool=True) -> None:
         """
-        Prints the board to the console
+        Prints the board to the console. The whole frame is built first and written all at once, so it doesn't flicker.
         :param enable_colorization: Indicates if the board will be colored (Only works correctly with a black console)
-        :param clear_screen: Indicates if the screen should be cleared before drawing the board (Windows only)
+        :param clear_screen: Indicates if the screen should be cleared before drawing the board
         """
 
-        # If we're clearing the console, then do it (Windows only)
+        frame = []
+
         if clear_screen:
-            os.system("cls")
+            frame.append(ConsoleHelper.CLEAR_SCREEN)
 
         if enable_colorization:
-            ConsoleHelper.set_print_foreground(self.get_current_player_color())
+            frame.append(ConsoleHelper.get_foreground_code(self.get_current_player_color()))
+
+        # The column numbers
+        frame.append("    ")
+        frame.extend(f" {i + 1}  " for i in range(self._board_size))
 
-        # Print the column numbers
-        print("    ", end='')
-        for i in range(self._board_size):
-            print(f" {i + 1}  ", end='')
+        separator = "\n    " + "+".join("---" for _ in range(self._board_size)) + " "
 
-        for row_num, row in enumerate(self._board):
+        for row_num, row in enumerate(self.get_board()):
 
-            # Make sure we move to the next line
-            print("\n", end='')
+            # Put the line below the cells of the last row before this one
+            if row_num > 0:
+                frame.append(separator)
 
             # Add the row number
-            print(f" {row_num + 1: >2} ", end='')
+            frame.append(f"\n {row_num + 1: >2} ")
 
-            # Print the row that has the actual cell contents
+            # Add the row that has the actual cell contents, highlighting the last move
             for col_num, cell in enumerate(row):
 
                 if (enable_colorization and
                         self._last_move is not None and
                         self._last_move[1] == row_num and
                         self._last_move[0] == col_num):
-                    ConsoleHelper.set_print_background(Color.WHITE)
-                    print(f" {cell} ", end='')
-                    ConsoleHelper.revert_print_background()
-                    print("|", end='')
+                    frame.append(ConsoleHelper.get_background_code(Color.WHITE))
+                    frame.append(f" {cell} ")
+                    frame.append(ConsoleHelper.get_background_code(Color.BLACK))
                 else:
-                    print(f" {cell} |", end='')
+                    frame.append(f" {cell} ")
 
-            # The line below the cells
-            print("\b \n    ", end='')
-            for i in range(len(row)):
-                print("---+", end='')
+                frame.append("|" if col_num < self._board_size - 1 else " ")
 
-            print("\b ", end='')
+        # There's a blank line below the board, in place of the last row's line
+        frame.append("\n\n")
 
-        # Don't you wish there was a comment explaining how this worked? :)
-        print("\r", flush=True, end='')
-        print("    " * (self._board_size + 1), flush=True)
+        sys.stdout.write("".join(frame))
+        sys.stdout.flush()
 
-        if enable_colorization:
-            ConsoleHelper.revert_print_foreground()
+    def _add_open_cell(self, move: Tuple[int, int]) -> None:
+        """
+        Adds a cell that was just opened to the open cells
+        """
 
-    def _check_for_winner(self):
+        self._open_cell_positions[(move[1] * self._board_size) + move[0]] = len(self._open_cells)
+        self._open_cells.append((move[0], move[1]))
+
+    def _check_for_winner(self) -> bool:
         # Short circuiting!
-        self._get_horizontal_winner() or self._get_vertical_winner() or self._get_diagonal_winner()
+        # Only the lines that go through the last move can have just been completed
+        return self._get_horizontal_winner() or self._get_vertical_winner() or self._get_diagonal_winner()
 
-    def _get_diagonal_winner(self) -> bool:
+    def _clear_cell(self, move: Tuple[int, int]) -> None:
         """
-        Checks both diagonals for a winner. If one is found, self._winner will be set.
-        :return: True if there is a winner
+        Opens the given cell, which the current player holds, and takes it out of their row, column, and diagonal counts
+        :param move: The 0-based coordinates of the cell
+        """
+
+        col, row = move
+        player = self._current_player
+
+        self._board[row][col] = self.NEUTRAL_PLAYER
+
+        self._row_counts[player][row] = self._row_counts[player][row] - 1
+        self._column_counts[player][col] = self._column_counts[player][col] - 1
+
+        if col == row:
+            self._diagonal_counts[player][0] = self._diagonal_counts[player][0] - 1
+
+        if col + row == self._board_size - 1:
+            self._diagonal_counts[player][1] = self._diagonal_counts[player][1] - 1
+
+    def _copy_board_from(self, game: "TicTacToe") -> None:
+        """
+        Replaces the board (and anything used to find a winner on it) with a copy of the given game's
         """
 
-        # Works basically the same as the horizontal and vertical checks. See there for comments
+        self._board = [row[:] for row in game._board]
+        self._row_counts = [counts[:] for counts in game._row_counts]
+        self._column_counts = [counts[:] for counts in game._column_counts]
+        self._diagonal_counts = [counts[:] for counts in game._diagonal_counts]
 
-        backward_winner = self._board[0][-0]  # top left to bottom right
-        forward_winner = self._board[0][-1]  # top right to bottom left
+    def _create_board(self) -> None:
+        """
+        Creates the empty board, along with anything that is used to find a winner on it
+        """
+
+        self._board = []
 
-        # Loop through the diagonals one time, and keep track of if everything stays the same
-        for diagonal in range(self._board_size):
-            if backward_winner != self.NEUTRAL_PLAYER and self._board[diagonal][diagonal] != backward_winner:
-                backward_winner = self.NEUTRAL_PLAYER
+        # How many cells each player holds in every row, column, and diagonal (backward, forward).
+        # These are indexed by the player first, so a win is just a count reaching the board size.
+        self._row_counts = [[0] * self._board_size for _ in self._players]
+        self._column_counts = [[0] * self._board_size for _ in self._players]
+        self._diagonal_counts = [[0, 0] for _ in self._players]
 
-            # Python array shenanigans
-            if forward_winner != self.NEUTRAL_PLAYER and self._board[diagonal][-diagonal - 1] != forward_winner:
-                forward_winner = self.NEUTRAL_PLAYER
+        for row in range(self._board_size):
+            self._board.append([])
+            for col in range(self._board_size):
+                self._board[row].append(self.NEUTRAL_PLAYER)
+
+    def _find_open_cells(self) -> None:
+        """
+        Finds every open cell on the board, and where each one is in the list of open cells
+        """
+
+        self._open_cells = []
+        self._open_cell_positions = [-1] * (self._board_size ** 2)  # The index into _open_cells of each cell number
+
+        for row in range(self._board_size):
+            for col in range(self._board_size):
+                if self._get_cell((col, row)) == self.NEUTRAL_PLAYER:
+                    self._open_cell_positions[(row * self._board_size) + col] = len(self._open_cells)
+                    self._open_cells.append((col, row))
+
+    def _get_cell(self, move: Tuple[int, int]) -> chr:
+        """
+        Gets who is in the given cell
+        :param move: The 0-based coordinates of the cell
+        :return: The player in the cell, or self.NEUTRAL_PLAYER if it's open
+        """
+        return self._board[move[1]][move[0]]
+
+    def _get_diagonal_winner(self) -> bool:
+        """
+        Checks the diagonals that go through the last move for a winner. If one is found, self._winner will be set.
+        :return: True if there is a winner
+        """
 
-        # If we had a winner, then return that winner, otherwise, return the self.NEUTRAL_PLAYER
-        if backward_winner != self.NEUTRAL_PLAYER:
-            self._winner = backward_winner
+        if self._last_move is None:
+            return False
+
+        col, row = self._last_move
+        diagonal_counts = self._diagonal_counts[self._current_player]
+
+        # top left to bottom right
+        if col == row and diagonal_counts[0] == self._board_size:
+            self._winner = self._players[self._current_player]
             self._win_edges = ((0, 0), (self._board_size - 1, self._board_size - 1))
             return True
 
-        if forward_winner != self.NEUTRAL_PLAYER:
-            self._winner = forward_winner
+        # top right to bottom left
+        if col + row == self._board_size - 1 and diagonal_counts[1] == self._board_size:
+            self._winner = self._players[self._current_player]
             self._win_edges = ((self._board_size - 1, 0), (0, self._board_size - 1))
             return True
 
@@ -206,61 +552,112 @@ class TicTacToe:
 
     def _get_horizontal_winner(self) -> bool:
         """
-        Checks all horizontal rows for a winner. If one is found, self._winner will be set.
+        Checks the row that goes through the last move for a winner. If one is found, self._winner will be set.
         :return: True if there is a winner
         """
 
-        # Loop through all the rows
-        for row_num, row in enumerate(self._board):
-            # Get the entry of the first cell in the row
-            winner = row[0]
-
-            # Loop through each cell in a given row
-            for cell in row:
+        if self._last_move is None:
+            return False
 
-                # If we haven't already found a blank cell this row
-                # and if the current cell is not our current value,
-                # then set it to be a self.NEUTRAL_PLAYER (not a winner)
-                if winner != self.NEUTRAL_PLAYER and cell != winner:
-                    winner = self.NEUTRAL_PLAYER
-                    break
+        row_num = self._last_move[1]
 
-            # Set the winning player if anybody won
-            if winner != self.NEUTRAL_PLAYER:
-                self._winner = winner
-                self._win_edges = ((0, row_num), (self._board_size - 1, row_num))
-                return True
+        # Set the winning player if they now fill the entire row
+        if self._row_counts[self._current_player][row_num] == self._board_size:
+            self._winner = self._players[self._current_player]
+            self._win_edges = ((0, row_num), (self._board_size - 1, row_num))
+            return True
 
-        # If we make it this far, then we did not find a winner
         return False
 
     def _get_vertical_winner(self) -> bool:
         """
-        Checks all vertical rows for a winner. If one is found, self._winner will be set.
+        Checks the column that goes through the last move for a winner. If one is found, self._winner will be set.
         :return: True if there is a winner
         """
 
-        # Loop through all columns
-        for col in range(self._board_size):
-            # Get the entry of the first cell in the column
-            winner = self._board[0][col]
-
-            # Loop through all the rows
-            for row in range(self._board_size):
-                cell = self._board[row][col]
+        if self._last_move is None:
+            return False
 
-                # If we haven't already found a blank cell this row
-                # and if the current cell is not our current value,
-                # then set it to be a self.NEUTRAL_PLAYER (not a winner)
-                if (winner != self.NEUTRAL_PLAYER and cell != winner) or cell == self.NEUTRAL_PLAYER:
-                    winner = self.NEUTRAL_PLAYER
-                    break
+        col = self._last_move[0]
 
-            # Set the winning player if anybody won
-            if winner != self.NEUTRAL_PLAYER:
-                self._winner = winner
-                self._win_edges = ((col, 0), (col, self._board_size - 1))
-                return True
+        # Set the winning player if they now fill the entire column
+        if self._column_counts[self._current_player][col] == self._board_size:
+            self._winner = self._players[self._current_player]
+            self._win_edges = ((col, 0), (col, self._board_size - 1))
+            return True
 
-        # If we make it this far, then we did not find a winner
         return False
+
+    def _is_on_win_line(self, move: Tuple[int, int]) -> bool:
+        """
+        Checks if the given cell is one of the cells of the winning line
+        """
+
+        (begin_x, begin_y), (end_x, end_y) = self._win_edges
+
+        if begin_y == end_y:  # Horizontal win
+            return move[1] == begin_y
+        elif begin_x == end_x:  # Vertical win
+            return move[0] == begin_x
+        elif begin_x == begin_y:  # Top left to bottom right
+            return move[0] == move[1]
+
+        # Top right to bottom left
+        return move[0] + move[1] == self._board_size - 1
+
+    def _play_move(self, move: Tuple[int, int]) -> None:
+        """
+        Makes a move that is known to be valid
+        :param move: The 0-based coordinates of the move
+        """
+
+        self._set_cell(move)
+        self._record_move(move, (move[1] * self._board_size) + move[0])
+
+        self._check_for_winner()
+
+        # Only change who the player is if we didn't get a winner,
+        # otherwise the final board's color will be wrong
+        if not self.is_winner():
+            self._current_player = (self._current_player + 1) % len(self._players)
+
+    def _record_move(self, move: Tuple[int, int], cell: int) -> None:
+        """
+        Keeps track of a move that was just put on the board (the opposite of what undo_move does after clearing it):
+        takes its cell out of the open cells, adds it to the hash and the moves, and makes it the last move.
+        Every engine's _play_move calls this, before the turn passes.
+        :param move: The 0-based coordinates of the move
+        :param cell: The move's cell number, which is (y * board size) + x
+        """
+
+        # Take the cell out of the open cells, by moving the last open cell into its place
+        position = self._open_cell_positions[cell]
+        last_cell = self._open_cells.pop()
+        if position < len(self._open_cells):
+            self._open_cells[position] = last_cell
+            self._open_cell_positions[(last_cell[1] * self._board_size) + last_cell[0]] = position
+
+        self._hash ^= self._zobrist_keys[self._current_player][cell]
+        self._number_of_moves = self._number_of_moves + 1
+        self._last_move = move
+        self._moves.append(move)
+
+    def _set_cell(self, move: Tuple[int, int]) -> None:
+        """
+        Puts the current player in the given cell, and adds it to their row, column, and diagonal counts
+        :param move: The 0-based coordinates of the cell
+        """
+
+        col, row = move
+        player = self._current_player
+
+        self._board[row][col] = self._players[player]
+
+        self._row_counts[player][row] = self._row_counts[player][row] + 1
+        self._column_counts[player][col] = self._column_counts[player][col] + 1
+
+        if col == row:
+            self._diagonal_counts[player][0] = self._diagonal_counts[player][0] + 1
+
+        if col + row == self._board_size - 1:
+            self._diagonal_counts[player][1] = self._diagonal_counts[player][1] + 1
@@ -0,0 +1,171 @@
+__author__ = "David Antonucci"
+__version__ = "1.0.0"
+
+import argparse
+import math
+import time
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from enums import GameEngine, MoveError
+from game_factory import create_game
+from minimax_player import MinimaxPlayer
+from mcts_player import MctsPlayer
+from players import GreedyPlayer, RandomPlayer
+from typing import Callable, Dict, List, NamedTuple, Sequence
+
+# The most seconds a minimax player may spend on a move, so a game on a big board still finishes
+DEFAULT_MINIMAX_TIME_LIMIT: float = 1.0
+
+# Each player only needs a choose_move(game) method that returns the 0-based (x, y) coordinates of its move.
+# Players that also have a reseed(seed) method are reseeded for every shard, so shards don't repeat each other.
+PLAYER_TYPES: Dict[str, Callable[[], object]] = {
+    "random": RandomPlayer,
+    "greedy": GreedyPlayer,
+    "minimax": lambda: MinimaxPlayer(time_limit=DEFAULT_MINIMAX_TIME_LIMIT),
+    "mcts": lambda: MctsPlayer(iterations=200),
+}
+
+
+class PlayerRecord(NamedTuple):
+    wins: int
+    draws: int
+    losses: int
+
+
+class TournamentResult(NamedTuple):
+    games: int
+    seconds: float
+    records: List[PlayerRecord]
+    move_latencies: List[array]  # The seconds each of a player's moves took
+
+    @property
+    def games_per_second(self) -> float:
+        return self.games / self.seconds if self.seconds > 0 else 0.0
+
+    def get_latency_percentile(self, player: int, percentile: float) -> float:
+        """
+        Gets a percentile (0 to 100) of the time one player's moves took, in seconds
+        """
+
+        latencies = sorted(self.move_latencies[player])
+        if not latencies:
+            return 0.0
+
+        index = min(len(latencies) - 1, max(0, math.ceil((percentile / 100) * len(latencies)) - 1))
+        return latencies[index]
+
+
+def _play_games(players: Sequence, board_size: int, engine: GameEngine, first_game: int,
+                number_of_games: int) -> TournamentResult:
+    """
+    Plays a shard of the tournament. The players take turns going first, based on the overall game number.
+    """
+
+    start = time.perf_counter()
+    results = [[0, 0, 0] for _ in players]
+    latencies = [array("d") for _ in players]
+    clock = time.perf_counter
+
+    for player_number, player in enumerate(players):
+        if hasattr(player, "reseed"):
+            player.reseed((first_game * len(players)) + player_number)
+
+    for game_number in range(first_game, first_game + number_of_games):
+        game = create_game(board_size, engine)
+        seats = [game_number % 2, (game_number + 1) % 2]  # Which player is X and which is O
+        turn = 0
+
+        while not game.is_winner() and not game.is_board_full():
+            player = seats[turn % 2]
+
+            move_start = clock()
+            move = players[player].choose_move(game)
+            latencies[player].append(clock() - move_start)
+
+            if game.make_move(move) != MoveError.OKAY:
+                raise ValueError(f"{type(players[player]).__name__} made the invalid move {move}")
+
+            turn = turn + 1
+
+        if game.is_winner():
+            # The current player is the winner, since the turn doesn't pass after a winning move
+            winner = seats[(turn - 1) % 2]
+            results[winner][0] += 1
+            results[1 - winner][2] += 1
+        else:
+            for record in results:
+                record[1] += 1
+
+    return TournamentResult(number_of_games, time.perf_counter() - start,
+                            [PlayerRecord(*record) for record in results], latencies)
+
+
+def run_tournament(players: Sequence, board_size: int, number_of_games: int, workers: int=1,
+                   engine: GameEngine=GameEngine.LIST) -> TournamentResult:
+    """
+    Plays two players against each other without any console or GUI
+    :param players: The two players. They take turns going first.
+    :param board_size: The size of the board
+    :param number_of_games: How many games to play
+    :param workers: How many processes to shard the games across
+    :param engine: Which engine the games are played on
+    :return: The combined results of every game
+    """
+
+    start = time.perf_counter()
+
+    if workers <= 1:
+        shards = [_play_games(players, board_size, engine, 0, number_of_games)]
+    else:
+        # Keep the shard sizes even, so every shard starts on a game where the first player goes first
+        shard_size = max(2, math.ceil(number_of_games / (workers * 4) / 2) * 2)
+        with ProcessPoolExecutor(workers) as executor:
+            futures = [executor.submit(_play_games, players, board_size, engine, first,
+                                       min(shard_size, number_of_games - first))
+                       for first in range(0, number_of_games, shard_size)]
+            shards = [future.result() for future in futures]
+
+    records = []
+    latencies = []
+    for player in range(len(players)):
+        records.append(PlayerRecord(*(sum(shard.records[player][i] for shard in shards) for i in range(3))))
+        latencies.append(array("d"))
+        for shard in shards:
+            latencies[player].extend(shard.move_latencies[player])
+
+    return TournamentResult(number_of_games, time.perf_counter() - start, records, latencies)
+
+
+def print_report(names: Sequence[str], result: TournamentResult) -> None:
+    """
+    Prints the win/draw/loss table, throughput, and move latencies of a tournament
+    """
+
+    print(f"{'Player':<12}{'Wins':>8}{'Draws':>8}{'Losses':>8}{'p50 ms':>10}{'p90 ms':>10}{'p99 ms':>10}")
+    for player, name in enumerate(names):
+        record = result.records[player]
+        percentiles = [result.get_latency_percentile(player, p) * 1000 for p in (50, 90, 99)]
+        print(f"{name:<12}{record.wins:>8}{record.draws:>8}{record.losses:>8}" +
+              "".join(f"{p:>10.3f}" for p in percentiles))
+
+    print(f"\n{result.games} games in {result.seconds:.2f}s ({result.games_per_second:.1f} games/s)")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Plays computer players against each other")
+    parser.add_argument("first", choices=PLAYER_TYPES)
+    parser.add_argument("second", choices=PLAYER_TYPES)
+    parser.add_argument("--size", type=int, default=3)
+    parser.add_argument("--games", type=int, default=1000)
+    parser.add_argument("--workers", type=int, default=1)
+    parser.add_argument("--engine", choices=[engine.name.lower() for engine in GameEngine], default="list")
+    parser.add_argument("--minimax-time-limit", type=float, default=DEFAULT_MINIMAX_TIME_LIMIT,
+                        help="The most seconds a minimax player may spend on a move")
+    parser.add_argument("--minimax-depth", type=int, default=None, help="The deepest a minimax player may search")
+    args = parser.parse_args()
+
+    PLAYER_TYPES["minimax"] = lambda: MinimaxPlayer(time_limit=args.minimax_time_limit, max_depth=args.minimax_depth)
+    tournament_players = [PLAYER_TYPES[args.first](), PLAYER_TYPES[args.second]()]
+    print_report([args.first, args.second],
+                 run_tournament(tournament_players, args.size, args.games, args.workers,
+                                GameEngine[args.engine.upper()]))